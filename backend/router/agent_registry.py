@@ -16,11 +16,12 @@ async def register_predefined_agents(gpt_service: GptService, config) -> List[st
     
     Args:
         gpt_service: The GPT service to register agents with
-        config: Configuration object
+        config: Configuration object (None = the GPT service's config)
         
     Returns:
         List of registered agent names
     """
+    config = config or gpt_service.config
     agents = get_predefined_agents(config)
     registered = []
     
@@ -34,7 +35,8 @@ async def register_predefined_agents(gpt_service: GptService, config) -> List[st
             description=agent.description,
             input_schema=agent.get_tool_definition()["function"]["parameters"],
             executor=agent.execute,
-            tool_type="agent"
+            tool_type="agent",
+            max_parallel=config.AGENT_MAX_PARALLEL or None,
         )
         
         registered.append(agent.name)
@@ -56,7 +58,7 @@ async def register_custom_agent(
     
     Args:
         gpt_service: The GPT service to register the agent with
-        config: Configuration object
+        config: Configuration object (None = the GPT service's config)
         name: Unique name for the agent
         description: What the agent does
         system_prompt: Custom system prompt
@@ -67,6 +69,7 @@ async def register_custom_agent(
     Returns:
         str: The registered agent name
     """
+    config = config or gpt_service.config
     # Create the agent
     agent = create_custom_agent(
         name=name,
@@ -86,7 +89,8 @@ async def register_custom_agent(
         description=agent.description,
         input_schema=agent.get_tool_definition()["function"]["parameters"],
         executor=agent.execute,
-        tool_type="agent"
+        tool_type="agent",
+        max_parallel=config.AGENT_MAX_PARALLEL or None,
     )
     
     return agent.name
@@ -102,12 +106,13 @@ async def register_specific_agents(
     
     Args:
         gpt_service: The GPT service to register agents with
-        config: Configuration object
+        config: Configuration object (None = the GPT service's config)
         agent_names: List of agent names to register
         
     Returns:
         List of registered agent names
     """
+    config = config or gpt_service.config
     all_agents = get_predefined_agents(config)
     agent_map = {agent.name: agent for agent in all_agents}
     registered = []
@@ -127,7 +132,8 @@ async def register_specific_agents(
             description=agent.description,
             input_schema=agent.get_tool_definition()["function"]["parameters"],
             executor=agent.execute,
-            tool_type="agent"
+            tool_type="agent",
+            max_parallel=config.AGENT_MAX_PARALLEL or None,
         )
         
         registered.append(agent.name)
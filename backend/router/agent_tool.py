@@ -18,7 +18,7 @@ import json
 import asyncio
 from typing import Dict, List, Any, Optional
 import httpx
-from gpt_service import GptService
+from gpt_service import GptService, ToolEntry
 from chat_types import ChatMessage
 from response_schema import AgentResponse
 from events import EventEmitter
@@ -64,7 +64,8 @@ class AgentTool(EventEmitter):
         self.name = name
         self.description = description
         self.system_prompt = system_prompt
-        self.available_tools = available_tools or []
+        # Immutable copy - also the permitted-tools cache key, so no per-turn tuple() copy
+        self.available_tools = tuple(available_tools or ())
         self.reasoning_effort = reasoning_effort
         self.model_config = model_config or {}
         self.stream_sub_agents = stream_sub_agents
@@ -76,7 +77,10 @@ class AgentTool(EventEmitter):
         self._setup_tool_call_event_forwarding()
 
         # Tool registry for this agent (will be populated when initialized)
-        self._agent_tool_registry: Dict[str, dict] = {}
+        self._agent_tool_registry: Dict[str, ToolEntry] = {}
+        # Service the tools were copied from, and its MCP tools version at the time
+        self._main_gpt_service: Optional[GptService] = None
+        self._mcp_tools_version = 0
 
     def _setup_tool_call_event_forwarding(self):
         """Set up tool call event forwarding from this agent's GPT service"""
@@ -121,7 +125,53 @@ class AgentTool(EventEmitter):
 
         # Initialize the agent's GPT service with the filtered tools
         self.gpt_service._tool_registry = self._agent_tool_registry
+        # Tools come from the main service, which is mid-init_tools when agents register
+        self.gpt_service._tools_ready = True
         self.gpt_service._mcp_client = main_gpt_service._mcp_client
+        self.gpt_service._http = main_gpt_service._http
+        self.gpt_service._tool_cache = main_gpt_service._tool_cache
+        self.gpt_service._tool_semaphore = main_gpt_service._tool_semaphore
+        self.gpt_service._tool_inflight = main_gpt_service._tool_inflight
+        self.gpt_service._semantic_cache = main_gpt_service._semantic_cache
+        self._main_gpt_service = main_gpt_service
+        self._mcp_tools_version = main_gpt_service._mcp_tools_version
+
+    def _sync_mcp_tools(self):
+        """
+        Pick up MCP tools the main service re-registered since this agent copied them
+
+        MCP tools can change after startup (a snapshot cold start refreshed in
+        the background, or a gateway's tools/list_changed). Only the MCP entries
+        are replaced; custom and agent tools keep what was copied at initialize.
+        """
+        main = self._main_gpt_service
+        if main is None or main._mcp_tools_version == self._mcp_tools_version:
+            return
+
+        main_registry = main._tool_registry
+        if self.available_tools:
+            registry = {}
+            for tool_name in self.available_tools:
+                entry = main_registry.get(tool_name)
+                if entry is None or entry.type != "mcp":
+                    # Not an MCP tool (any more) - keep the copied entry unless it was one
+                    entry = self._agent_tool_registry.get(tool_name)
+                    if entry is not None and entry.type == "mcp":
+                        entry = None
+                if entry is not None:
+                    registry[tool_name] = entry
+        else:
+            registry = {
+                name: entry for name, entry in self._agent_tool_registry.items() if entry.type != "mcp"
+            }
+            registry.update(
+                (name, entry) for name, entry in main_registry.items() if entry.type == "mcp"
+            )
+
+        self._agent_tool_registry = registry
+        self.gpt_service._tool_registry = registry
+        self.gpt_service._registry_version += 1
+        self._mcp_tools_version = main._mcp_tools_version
 
     async def run(self, messages: List[ChatMessage] = []) -> AgentResponse:
         """
@@ -140,6 +190,8 @@ class AgentTool(EventEmitter):
             "messages": [{"role": msg.role, "content": msg.content} for msg in messages],
         })
 
+        self._sync_mcp_tools()
+
         try:
             # Get response from agent using streaming with system prompt
             response_chunks = []
@@ -38,6 +38,14 @@ REASONING_EFFORT = os.getenv("REASONING_EFFORT", "low")  # "low", "medium", "hig
 INFERENCE_URL = os.getenv("INFERENCE_URL", "http://localhost:8080")
 
 INFERENCE_TIMEOUT = int(os.getenv("INFERENCE_TIMEOUT", "300"))
+INFERENCE_MAX_CONNECTIONS = int(os.getenv("INFERENCE_MAX_CONNECTIONS", "64"))
+INFERENCE_KEEPALIVE_EXPIRY = float(os.getenv("INFERENCE_KEEPALIVE_EXPIRY", "120"))  # Seconds an idle pooled connection is kept
+INFERENCE_HTTP2 = os.getenv("INFERENCE_HTTP2", "true").lower() == "true"  # Used only when the h2 package is installed
+INFERENCE_CACHE_PROMPT = os.getenv("INFERENCE_CACHE_PROMPT", "true").lower() == "true"  # Send cache_prompt to local llama.cpp
+INFERENCE_RATE_LIMIT = float(os.getenv("INFERENCE_RATE_LIMIT", "0"))  # Completion requests per second, 0 = unlimited
+INFERENCE_RATE_BURST = float(os.getenv("INFERENCE_RATE_BURST", "0"))  # Burst allowance, 0 = one second's worth
+INFERENCE_RETRIES = int(os.getenv("INFERENCE_RETRIES", "3"))  # Retries of transient errors before streaming starts
+RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "0.25"))  # Seconds, doubled on each retry
 REMOTE_INFERENCE_URL="https://api.studio.nebius.com"
 REMOTE_INFERENCE_KEY=os.getenv("REMOTE_INFERENCE_KEY", "")
 USE_REMOTE_INFERENCE =  os.getenv("USE_REMOTE_INFERENCE", "false").lower() == "true"
@@ -55,6 +63,12 @@ BRAVE_API_KEY = os.getenv("BRAVE_API_KEY", "")
 MCP_BRAVE_URL = os.getenv("MCP_BRAVE_URL", "http://mcp-brave:3000") + "/mcp/"
 MCP_FETCH_URL = os.getenv("MCP_FETCH_URL", "http://mcp-fetch:8000") + "/mcp/"
 MCP_URLS = [MCP_BRAVE_URL, MCP_FETCH_URL]
+MCP_TOOLS_TTL = int(os.getenv("MCP_TOOLS_TTL", "300"))  # Seconds to reuse a tools/list result
+MCP_TOOLS_SNAPSHOT = os.getenv("MCP_TOOLS_SNAPSHOT", "")  # File to persist tools/list for fast cold starts, "" disables
+MCP_TOOLS_SNAPSHOT_MAX_AGE = int(os.getenv("MCP_TOOLS_SNAPSHOT_MAX_AGE", "86400"))  # Seconds a snapshot is trusted
+MCP_RATE_LIMIT = float(os.getenv("MCP_RATE_LIMIT", "0"))  # Tool calls per second per gateway, 0 = unlimited
+MCP_RATE_BURST = float(os.getenv("MCP_RATE_BURST", "0"))  # Burst allowance, 0 = one second's worth
+MCP_RETRIES = int(os.getenv("MCP_RETRIES", "2"))  # Retries of a tool call after connection errors / 502-504
 OPENAI_MODEL="openai/gpt-oss-20b"
 # ... rest of your existing config
 # Embeddings service settings
@@ -78,3 +92,24 @@ MAX_TOKENS = 4096
 
 # Tool calling settings
 ENABLE_TOOL_CALLS = os.getenv("ENABLE_TOOL_CALLS", "true").lower() == "true"
+TOOL_THREADS = int(os.getenv("TOOL_THREADS", "8"))  # Worker threads for synchronous tool executors
+PARALLEL_TOOL_EXECUTION = os.getenv("PARALLEL_TOOL_EXECUTION", "true").lower() == "true"  # Run one turn's tool calls concurrently
+TOOL_CONCURRENCY_LIMIT = int(os.getenv("TOOL_CONCURRENCY_LIMIT", "8"))  # Concurrent MCP/custom tool calls per process, 0 = unlimited
+AGENT_MAX_PARALLEL = int(os.getenv("AGENT_MAX_PARALLEL", "2"))  # Concurrent calls to each sub-agent tool, 0 = unlimited
+STRICT_TOOL_SCHEMAS = os.getenv("STRICT_TOOL_SCHEMAS", "false").lower() == "true"  # Send "strict": true for tools whose schemas allow it
+
+# Tool result caching - seconds a successful result is reused for identical arguments.
+# Keys are tool names or fnmatch patterns; tools without an entry are never cached.
+TOOL_CACHE_TTLS = {
+    "brave_web_search": 300,
+    "fetch": 600,
+    "custom_mcp_fetch": 600,
+    "weather_*": 60,
+    # Sub-agents whose answer depends only on the task and context they are given
+    "summary_agent": 300,
+    "technical_agent": 300,
+}
+TOOL_CACHE_SIZE = int(os.getenv("TOOL_CACHE_SIZE", "512"))
+# Reuse cached results for near-identical search queries (cosine similarity of query embeddings)
+SEMANTIC_TOOL_CACHE = os.getenv("SEMANTIC_TOOL_CACHE", "false").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
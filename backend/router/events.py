@@ -6,6 +6,10 @@ This provides a basic event emitter pattern for the Agent/Orchestrator system.
 
 from typing import Any, Callable, Dict, List
 import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 class EventEmitter:
@@ -47,7 +51,7 @@ class EventEmitter:
                     else:
                         callback(*args, **kwargs)
                 except Exception as e:
-                    print(f"Error in event listener for {event}: {e}")
+                    logger.error("Error in event listener for %s: %s", event, e)
     
     async def emit_async(self, event: str, *args, **kwargs):
         """Emit an event to all listeners (async version)"""
@@ -63,7 +67,7 @@ class EventEmitter:
                             None, callback, *args, **kwargs
                         ))
                 except Exception as e:
-                    print(f"Error in event listener for {event}: {e}")
+                    logger.error("Error in event listener for %s: %s", event, e)
             
             if tasks:
                 await asyncio.gather(*tasks, return_exceptions=True)
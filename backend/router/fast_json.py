@@ -0,0 +1,36 @@
+"""
+JSON encoding/decoding for hot paths (SSE parsing, request bodies)
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. dumps() always returns compact UTF-8 bytes, loads() accepts
+bytes or str, and decode errors are always json.JSONDecodeError (orjson's
+error type subclasses it).
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - stdlib json produces the same output, just slower
+    orjson = None
+
+
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    loads = orjson.loads
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: Union[bytes, bytearray, str]) -> Any:
+        """Deserialize JSON from bytes or str"""
+        return json.loads(data)
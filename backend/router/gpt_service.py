@@ -13,43 +13,372 @@ ARCHITECTURE:
 - Tool execution is abstracted - the LLM doesn't know which type it's calling
 """
 
+import asyncio
+import contextlib
+import fnmatch
+import functools
+import hashlib
+import inspect
 import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List,  Callable, Optional
+from typing import Dict, List,  Callable, Optional, Sequence, Tuple
 from constants import MAX_TOOL_CALLS
 import httpx
 from response_schema import AgentResponse
-from process_llm_response import execute_single_tool_call, process_llm_response_with_tools
+from process_llm_response import (
+    CONTINUE,
+    EMPTY,
+    STOP,
+    execute_single_tool_call,
+    process_llm_response_with_tools,
+    stream_llm_response,
+)
 from events import EventEmitter
-from extract_relevant_from_webpage import extract_relevant_text
+from extract_relevant_from_webpage import extract_relevant_text, model as embedding_model
+import fast_json
+from premise_hints import premise_hint
+from rate_limit import get_bucket
+from retry import RETRYABLE_STATUS, with_retry
+from semantic_cache import SemanticToolCache
+
+try:
+    from jsonschema import Draft7Validator
+    from jsonschema.exceptions import SchemaError, best_match
+except ImportError:
+    # jsonschema is optional - tool arguments are passed through unvalidated without it
+    Draft7Validator = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    # fastjsonschema is optional - jsonschema validates the same schemas, just slower
+    fastjsonschema = None
+
+try:
+    import h2  # noqa: F401 - httpx needs it for http2=True
+    HTTP2_AVAILABLE = True
+except ImportError:
+    # Without h2 the inference client stays on HTTP/1.1 keep-alive connections
+    HTTP2_AVAILABLE = False
 
 
 # MCP imports
 from simple_mcp_client import SimpleMCPClient
 
+logger = logging.getLogger(__name__)
+
+# Instruction appended to the conversation once MAX_TOOL_CALLS is reached. The
+# system prompt is left alone so the inference server can reuse the KV cache
+# for the whole conversation prefix. Shared across requests - treat as immutable.
+FINAL_USER_MSG = {
+    "role": "user",
+    "content": """You've gathered information for my question.
+YOU NO LONGER HAVE ACCESS TO TOOLS.
+
+Now provide a clear, complete answer to my question using the context you have. Include relevant facts, data, and citations. Be direct and helpful.
+
+CRITICAL - Handle Contradictions:
+- If the search results show information that contradicts the question (e.g., it asks for 'president' but the country has 'prime minister'), CLARIFY the distinction in your answer.
+- If a title or term in the question doesn't match reality, explain what the correct term is and provide the accurate information.
+- Example: If asked "who is the president of Spain", clarify that Spain has a Prime Minister (not a president) and provide both the Prime Minister's name and the King's name.
+- Never use the following formatting: |, ---, or any advanced markdown features in your responses.
+
+Important: This is your FINAL response - make it complete, accurate, and actionable.""",
+}
+
+# Fixed options sent with every mcp_fetch_tool request (the URL is added per call)
+_FETCH_ARGS_TEMPLATE = {
+    "max_length": 10000,
+    "html": True,
+    "include_links": True,
+    "include_tables": True,
+    "include_code": True,
+    # Try to add recursive flag if the tool supports it
+    "recursive": True,
+}
+
+@functools.lru_cache(maxsize=8)
+def _chat_completion_params(
+    api_key: Optional[str],
+    use_remote: bool,
+    remote_url: str,
+    remote_model: str,
+    local_url: str,
+) -> Tuple[Dict[str, str], str, str]:
+    """Build (headers, model, url) once per inference configuration"""
+    headers = {"Content-Type": "application/json"}
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+
+    if use_remote:
+        return headers, remote_model, remote_url
+    return headers, "gpt-3.5-turbo", local_url
+
+
+@functools.lru_cache(maxsize=32)
+def _encode_request_tail(
+    model: str,
+    final: bool,
+    tools_json: Optional[bytes],
+    cache_prompt: bool = False,
+    reasoning_effort: str = "low",
+) -> bytes:
+    """
+    Encode every field of a streaming completion request except "messages"
+
+    These depend only on the model, the call type, the reasoning effort and
+    the tool set, so the encoded bytes are reused across rounds. The result continues a body that
+    starts with '{"messages":<conversation>' and includes the closing brace.
+    """
+    if not final:
+        fields = {
+            "max_tokens": 32767,
+            "max_output_tokens": 32767,
+            "stream": True,
+            "model": model,
+            "reasoning_effort": reasoning_effort,
+            "temperature": .9,
+        }
+        if tools_json is not None:
+            fields["tool_choice"] = "auto"
+    else:
+        # Same tool list as the tool-calling rounds, so the rendered prompt prefix
+        # (and the server's KV cache for it) is unchanged; synthesis runs at "low"
+        fields = {
+            "max_tokens": 32767,
+            "max_output_tokens": 32767,
+            "top_p": 1.0,
+            "temperature": .9,
+            "reasoning_effort": "low",
+            "stream": True,
+            "model": model,
+            "tool_choice": "none",
+        }
+
+    if cache_prompt:
+        # llama.cpp server: reuse the KV cache of the longest matching prompt prefix
+        fields["cache_prompt"] = True
+
+    tail = b"," + fast_json.dumps(fields)[1:]
+    if tools_json is not None:
+        # Splice the pre-serialized tool schemas into the request object
+        tail = tail[:-1] + b',"tools":' + tools_json + b"}"
+    return tail
+
+
+# Last tool call timestamp formatted: (epoch milliseconds, ISO string)
+_last_iso: Tuple[int, str] = (-1, "")
+
+
+def _iso_timestamp(now: float) -> str:
+    """ISO timestamp of now, reusing the previous string within the same millisecond"""
+    global _last_iso
+    ms = int(now * 1000)
+    if ms != _last_iso[0]:
+        _last_iso = (ms, datetime.fromtimestamp(ms / 1000).isoformat(timespec="milliseconds"))
+    return _last_iso[1]
+
+
+# tiktoken encoder for mcp_fetch_tool token counts (loaded on first use)
+_token_encoder = None
+_token_encoder_lock = threading.Lock()
+
+
+def _get_token_encoder():
+    """Return the shared tiktoken encoder, loading its BPE tables on first use"""
+    global _token_encoder
+    if _token_encoder is None:
+        with _token_encoder_lock:
+            if _token_encoder is None:
+                import tiktoken
+                _token_encoder = tiktoken.get_encoding("cl100k_base")
+    return _token_encoder
+
+
+# Extracted text per (content hash, query) - repeat fetches skip re-embedding the page
+_RELEVANT_TEXT_CACHE_SIZE = 256
+_relevant_text_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+
+def _extract_relevant_text_cached(content: str, query: str) -> str:
+    """extract_relevant_text for mcp_fetch_tool, memoized on the page content and query"""
+    key = (hashlib.blake2b(content.encode(), digest_size=16).hexdigest(), query)
+    relevant_text = _relevant_text_cache.get(key)
+    if relevant_text is not None:
+        _relevant_text_cache.move_to_end(key)
+        return relevant_text
+
+    relevant_text = extract_relevant_text(content, query, max_chars=1000, max_blocks=1000)
+    _relevant_text_cache[key] = relevant_text
+    if len(_relevant_text_cache) > _RELEVANT_TEXT_CACHE_SIZE:
+        _relevant_text_cache.popitem(last=False)
+    return relevant_text
+
+
+async def _iter_sse_data(resp: httpx.Response):
+    """
+    Yield the raw payload of each ``data:`` line in an SSE response
+
+    Splits the byte stream on newlines directly instead of going through
+    ``aiter_lines``, so protocol scaffolding is never decoded to str.
+    Stops at the ``[DONE]`` sentinel.
+    """
+    buf = bytearray()
+    async for chunk in resp.aiter_bytes():
+        buf.extend(chunk)
+        # Walk every complete line in the buffer, then drop them in one go
+        start = 0
+        while (i := buf.find(b"\n", start)) != -1:
+            if buf.startswith(b"data: ", start):
+                end = i - 1 if i > start and buf[i - 1] == 13 else i  # strip "\r"
+                payload = bytes(memoryview(buf)[start + 6:end])
+                if payload == b"[DONE]":
+                    return
+                yield payload
+            start = i + 1
+        if start:
+            del buf[:start]
+
+    # Flush a trailing line that was not newline-terminated
+    line = bytes(buf).rstrip(b"\r")
+    if line.startswith(b"data: ") and line != b"data: [DONE]":
+        yield line[6:]
+
+
+# First string-valued "content" / "reasoning_content" field of a compact SSE frame
+_DELTA_TEXT_RE = re.compile(rb'"(content|reasoning_content)":"((?:[^"\\]|\\.)*)"')
+
+
+def _parse_sse_frame(data: bytes) -> dict:
+    """
+    Decode one SSE data frame into a chat completion chunk
+
+    Plain text deltas (no tool calls, no finish reason) are the bulk of a
+    stream; for those only the text field is decoded and a minimal chunk is
+    built. Anything else falls back to a full JSON parse.
+    """
+    if b'"tool_calls"' not in data and (
+        b'"finish_reason"' not in data or b'"finish_reason":null' in data
+    ):
+        match = _DELTA_TEXT_RE.search(data)
+        if match is not None and match.group(2):
+            text = fast_json.loads(b'"' + match.group(2) + b'"')
+            return {"choices": [{"delta": {match.group(1).decode(): text}}]}
+
+    return fast_json.loads(data)
+
 
 # Maximum number of tool calls in a single conversation turn
 
 
 
 
+class ToolEntry:
+    """Tool registry entry (see GptService._register_tool)"""
+
+    __slots__ = (
+        "description",
+        "input_schema",
+        "executor",
+        "type",
+        "validator",
+        "cache_ttl",
+        "openai_spec",
+        "limiter",
+    )
+
+    def __init__(
+        self,
+        description: str,
+        input_schema: dict,
+        executor: Callable,
+        type: str,
+        validator=None,
+        cache_ttl: int = 0,
+        openai_spec: Optional[dict] = None,
+        limiter: Optional[asyncio.Semaphore] = None,
+    ):
+        self.description = description
+        self.input_schema = input_schema
+        self.executor = executor
+        self.type = type
+        self.validator = validator
+        self.cache_ttl = cache_ttl
+        self.openai_spec = openai_spec
+        self.limiter = limiter
+
+
 class GptService:
     """Main service for handling GPT requests with tool support"""
 
     def __init__(self, config, event_emitter: EventEmitter, can_log: bool = False):
         # Store the event emitter
         self.event_emitter = event_emitter
-        # Tool registry: name -> {description, input_schema, executor, type}
-        self._tool_registry: Dict[str, dict] = {}
+        # Tool registry: name -> ToolEntry
+        self._tool_registry: Dict[str, ToolEntry] = {}
+        # Set by init_tools (or copied from an initialized service) - an empty
+        # registry alone doesn't mean init never ran, e.g. when MCP is down
+        self._tools_ready = False
+        self._init_lock = asyncio.Lock()
+        # Canonical schema JSON -> (shared schema, compiled validator)
+        self._schema_intern: Dict[str, Tuple[dict, Optional[Callable]]] = {}
         self.config = config
         self.can_log = can_log
 
         # MCP client (if MCP is enabled)
         self._mcp_client: Optional[SimpleMCPClient] = None
+        # First MCP fetch tool, used by custom_mcp_fetch
+        self._primary_fetch_tool: Optional[str] = None
+        # Cached MCP tools/list result: (expiry timestamp, tools)
+        self._mcp_tools_cache: Tuple[float, Optional[List[dict]]] = (0.0, None)
+        # Background handshake after a cold start from the tools snapshot
+        self._mcp_refresh_task: Optional[asyncio.Task] = None
+        # Serializes re-listing after list_changed; at most one more re-list waits behind it
+        self._mcp_relist_lock = asyncio.Lock()
+        self._mcp_relist_queued = False
+        # Bumped whenever the MCP tools are (re-)registered, so agents can pick them up
+        self._mcp_tools_version = 0
         
+        # Thread pool for synchronous tool executors (created on first use)
+        self._blocking_pool: Optional[ThreadPoolExecutor] = None
+
+        # Pooled HTTP client for the inference server, shared with per-request copies
+        self._http: Optional[httpx.AsyncClient] = None
+        # Tool result cache: key -> (expiry timestamp, result), shared with per-request copies
+        self._tool_cache: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        # Cap on concurrently running leaf tool calls, shared with per-request copies
+        self._tool_semaphore: Optional[asyncio.Semaphore] = None
+        if config.TOOL_CONCURRENCY_LIMIT > 0:
+            self._tool_semaphore = asyncio.Semaphore(config.TOOL_CONCURRENCY_LIMIT)
+        # Running cacheable tool calls by cache key, so identical concurrent calls share one run
+        self._tool_inflight: Dict[str, asyncio.Future] = {}
+        # Optional near-duplicate query lookup in front of the tool result cache
+        self._semantic_cache: Optional[SemanticToolCache] = None
+        if config.SEMANTIC_TOOL_CACHE:
+            self._semantic_cache = SemanticToolCache(
+                functools.partial(embedding_model.encode, normalize_embeddings=True),
+                threshold=config.SEMANTIC_CACHE_THRESHOLD,
+                max_entries=config.TOOL_CACHE_SIZE,
+            )
+        # OpenAI-format tool lists per permitted tool set, valid for one registry version
+        self._registry_version = 0
+        # (entries are the tool list and its JSON encoding)
+        self._tools_for_llm_cache: Dict[Tuple[int, Tuple[str, ...]], Tuple[List[dict], Optional[bytes]]] = {}
+
         # Tool call tracking
         self._tool_call_count = 0
         self._tool_call_history: List[dict] = []
+        self._tool_call_stats = self._new_tool_call_stats()
+
+        # Dispatch the tool calls of one assistant turn concurrently
+        self.enable_parallel_tool_execution = config.PARALLEL_TOOL_EXECUTION
 
 
     # ------------------------------------------------------------------------
@@ -60,64 +389,73 @@ class GptService:
         """Get the total number of tool calls made in this session"""
         return self._tool_call_count
     
-    def get_tool_call_history(self) -> List[dict]:
-        """Get the history of all tool calls made in this session"""
-        return self._tool_call_history.copy()
+    def get_tool_call_history(self) -> Tuple[dict, ...]:
+        """
+        Get the history of all tool calls made in this session
+
+        Returns a snapshot of the records; their timestamps are formatted when
+        the call is recorded (memoized per millisecond), so this copies
+        references only.
+        """
+        return tuple(self._tool_call_history)
     
     def reset_tool_call_tracking(self):
         """Reset tool call tracking counters"""
         self._tool_call_count = 0
         self._tool_call_history.clear()
+        self._tool_call_stats = self._new_tool_call_stats()
+
+    @staticmethod
+    def _new_tool_call_stats() -> dict:
+        """Running aggregates behind get_tool_call_statistics"""
+        return {"total_execution_time": 0.0, "tool_usage": Counter(), "successful_calls": 0}
     
-    def _track_tool_call(self, tool_name: str, arguments: dict, result: dict, execution_time: float = 0.0):
-        """Track a tool call for monitoring and debugging"""
+    def _track_tool_call(self, tool_call_record: dict):
+        """
+        Track a tool call for monitoring and debugging
+
+        Args:
+            tool_call_record: dict with tool_name, arguments, result and execution_time.
+                Stored as-is (not copied); call_number and timestamp are added to it.
+        """
         self._tool_call_count += 1
-        tool_call_record = {
-            "call_number": self._tool_call_count,
-            "tool_name": tool_name,
-            "arguments": arguments,
-            "result": result,
-            "execution_time": execution_time,
-            "timestamp": datetime.now().isoformat()
-        }
+        tool_call_record["call_number"] = self._tool_call_count
+        tool_call_record["timestamp"] = _iso_timestamp(time.time())
         self._tool_call_history.append(tool_call_record)
+
+        stats = self._tool_call_stats
+        stats["total_execution_time"] += tool_call_record["execution_time"]
+        stats["tool_usage"][tool_call_record["tool_name"]] += 1
+        # Check if call was successful (no error in result)
+        if "error" not in tool_call_record["result"]:
+            stats["successful_calls"] += 1
         
         if self.can_log:
-            print(f"🔧 Tool call #{self._tool_call_count}: {tool_name} (took {execution_time:.2f}s)")
+            logger.info(
+                "🔧 Tool call #%d: %s (took %.2fs)",
+                self._tool_call_count,
+                tool_call_record["tool_name"],
+                tool_call_record["execution_time"],
+            )
     
     def get_tool_call_statistics(self) -> dict:
         """Get statistics about tool calls made in this session"""
-        if not self._tool_call_history:
+        total_calls = self._tool_call_count
+        if not total_calls:
             return {
                 "total_calls": 0,
                 "average_execution_time": 0.0,
                 "tool_usage": {},
                 "success_rate": 0.0
             }
-        
-        total_calls = len(self._tool_call_history)
-        total_execution_time = sum(call["execution_time"] for call in self._tool_call_history)
-        average_execution_time = total_execution_time / total_calls
-        
-        # Count tool usage
-        tool_usage = {}
-        successful_calls = 0
-        
-        for call in self._tool_call_history:
-            tool_name = call["tool_name"]
-            tool_usage[tool_name] = tool_usage.get(tool_name, 0) + 1
-            
-            # Check if call was successful (no error in result)
-            if "error" not in call["result"]:
-                successful_calls += 1
-        
-        success_rate = (successful_calls / total_calls) * 100 if total_calls > 0 else 0
-        
+
+        total_execution_time = self._tool_call_stats["total_execution_time"]
+
         return {
             "total_calls": total_calls,
-            "average_execution_time": average_execution_time,
-            "tool_usage": tool_usage,
-            "success_rate": success_rate,
+            "average_execution_time": total_execution_time / total_calls,
+            "tool_usage": dict(self._tool_call_stats["tool_usage"]),
+            "success_rate": (self._tool_call_stats["successful_calls"] / total_calls) * 100,
             "total_execution_time": total_execution_time
         }
 
@@ -132,6 +470,9 @@ class GptService:
         input_schema: dict,
         executor: Callable,
         tool_type: str = "custom",
+        cacheable: bool = True,
+        parallel_safe: bool = True,
+        max_parallel: Optional[int] = None,
     ):
         """
         Register a tool in the registry
@@ -140,15 +481,185 @@ class GptService:
             name: Unique tool identifier
             description: What the tool does (shown to LLM)
             input_schema: JSON schema for tool parameters
-            executor: Async function that executes the tool
+            executor: Function that executes the tool. Synchronous executors are
+                run on a thread pool so they cannot block the event loop.
             tool_type: "mcp" or "custom"
+            cacheable: False for tools with side effects. Results of cacheable
+                tools are reused for the TTL configured in TOOL_CACHE_TTLS.
+            parallel_safe: False for tools that must not run concurrently with
+                themselves. Tool calls from one LLM turn run concurrently;
+                calls to a tool that is not parallel safe are serialized.
+            max_parallel: Cap on concurrent calls to this tool; further calls
+                wait for a slot. None means no per-tool cap.
         """
-        self._tool_registry[name] = {
-            "description": description,
-            "input_schema": input_schema,
-            "executor": executor,
-            "type": tool_type,
-        }
+        self._tool_registry[name] = self._make_tool_entry(
+            name, description, input_schema, executor, tool_type, cacheable, parallel_safe, max_parallel
+        )
+        self._registry_version += 1
+
+    def _make_tool_entry(
+        self,
+        name: str,
+        description: str,
+        input_schema: dict,
+        executor: Callable,
+        tool_type: str,
+        cacheable: bool = True,
+        parallel_safe: bool = True,
+        max_parallel: Optional[int] = None,
+    ) -> ToolEntry:
+        """Build a tool registry entry (see _register_tool for the arguments)"""
+        if not inspect.iscoroutinefunction(executor):
+            executor = self._wrap_blocking_executor(executor)
+
+        input_schema, validator = self._intern_schema(name, input_schema)
+
+        # OpenAI function calling definition, built once (only for tools with valid schemas)
+        openai_spec = None
+        if input_schema and "properties" in input_schema:
+            openai_spec = {
+                "type": "function",
+                "function": {
+                    "name": name,
+                    "description": description,
+                    "parameters": input_schema,
+                },
+            }
+            if self.config.STRICT_TOOL_SCHEMAS:
+                strict_parameters = self._strict_parameters(input_schema)
+                if strict_parameters is not None:
+                    openai_spec["function"]["parameters"] = strict_parameters
+                    openai_spec["function"]["strict"] = True
+
+        return ToolEntry(
+            description=description,
+            input_schema=input_schema,
+            executor=executor,
+            type=tool_type,
+            validator=validator,
+            cache_ttl=self._tool_cache_ttl(name) if cacheable else 0,
+            openai_spec=openai_spec,
+            limiter=asyncio.Semaphore(1 if not parallel_safe else max_parallel)
+            if not parallel_safe or max_parallel else None,
+        )
+
+    def _intern_schema(self, name: str, input_schema: dict) -> Tuple[dict, Optional[Callable[[dict], Optional[str]]]]:
+        """
+        Return the shared copy of input_schema and its compiled validator
+
+        Tools with identical schemas (all sub-agents, MCP tools re-registered
+        after a reconnect) share one schema object and one validator.
+        """
+        if not input_schema:
+            return input_schema, None
+
+        key = json.dumps(input_schema, sort_keys=True, separators=(",", ":"), default=str)
+        entry = self._schema_intern.get(key)
+        if entry is None:
+            entry = (input_schema, self._compile_schema_validator(name, input_schema))
+            self._schema_intern[key] = entry
+        return entry
+
+    @classmethod
+    def _strict_parameters(cls, schema: dict) -> Optional[dict]:
+        """
+        Strict-mode copy of a parameters schema, or None if it can't be expressed
+
+        Strict mode needs every object to list all of its properties as required
+        and to forbid additional properties. Schemas with optional fields are
+        left as they are rather than changing what the model has to send.
+        """
+        if not isinstance(schema, dict):
+            return schema
+
+        strict = dict(schema)
+        if "properties" in schema:
+            properties = {}
+            for key, value in schema["properties"].items():
+                strict_value = cls._strict_parameters(value)
+                if strict_value is None:
+                    return None
+                properties[key] = strict_value
+            if set(schema.get("required", ())) != set(properties):
+                return None
+            strict["properties"] = properties
+            strict["additionalProperties"] = False
+        if "items" in schema:
+            strict_items = cls._strict_parameters(schema["items"])
+            if strict_items is None:
+                return None
+            strict["items"] = strict_items
+        return strict
+
+    def _tool_cache_ttl(self, name: str) -> int:
+        """Look up the result cache TTL for a tool (0 = not cached)"""
+        ttls = self.config.TOOL_CACHE_TTLS
+        if name in ttls:
+            return ttls[name]
+        for pattern, ttl in ttls.items():
+            if fnmatch.fnmatchcase(name, pattern):
+                return ttl
+        return 0
+
+    def _wrap_blocking_executor(self, executor: Callable) -> Callable:
+        """Wrap a synchronous executor so it runs on the blocking thread pool"""
+        if self._blocking_pool is None:
+            self._blocking_pool = ThreadPoolExecutor(
+                max_workers=self.config.TOOL_THREADS, thread_name_prefix="tool-executor"
+            )
+        pool = self._blocking_pool
+
+        async def run_in_pool(args: dict):
+            return await asyncio.get_running_loop().run_in_executor(pool, executor, args)
+
+        return run_in_pool
+
+    def _compile_schema_validator(self, name: str, input_schema: dict) -> Optional[Callable[[dict], Optional[str]]]:
+        """
+        Build an argument validator for a tool schema once, at registration
+
+        The validator returns an error message for invalid arguments and None
+        otherwise. fastjsonschema compiles the schema to a Python function and
+        is used when installed; jsonschema is the fallback. Returns None when
+        neither is available or the schema has nothing to validate, in which
+        case arguments are forwarded as-is.
+        """
+        if not input_schema or "properties" not in input_schema:
+            return None
+
+        if fastjsonschema is not None:
+            try:
+                # use_default=False - validation must not fill defaults into the arguments
+                validate = fastjsonschema.compile(input_schema, use_default=False)
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                logger.warning("Skipping argument validation for tool '%s': invalid schema (%s)", name, e)
+                return None
+
+            def check_fast(arguments: dict) -> Optional[str]:
+                try:
+                    validate(arguments)
+                except fastjsonschema.JsonSchemaValueException as e:
+                    return e.message
+                return None
+
+            return check_fast
+
+        if Draft7Validator is None:
+            return None
+
+        try:
+            Draft7Validator.check_schema(input_schema)
+        except SchemaError as e:
+            logger.warning("Skipping argument validation for tool '%s': invalid schema (%s)", name, e.message)
+            return None
+
+        validator = Draft7Validator(input_schema)
+
+        def check(arguments: dict) -> Optional[str]:
+            error = best_match(validator.iter_errors(arguments))
+            return error.message if error is not None else None
+
+        return check
 
     async def _register_custom_tools(self):
         """
@@ -174,30 +685,13 @@ class GptService:
                 if not parsed_url.scheme or not parsed_url.netloc:
                     return {"error": "Invalid URL format"}
 
-                # Find available MCP fetch tools
-                fetch_tools = [
-                    tool_name
-                    for tool_name, tool_info in self._tool_registry.items()
-                    if tool_info.get("type") == "mcp" and "fetch" in tool_name.lower()
-                ]
-
-                if not fetch_tools:
+                # Use the first available MCP fetch tool (resolved at MCP registration)
+                fetch_tool_name = self._primary_fetch_tool
+                if not fetch_tool_name:
                     return {"error": "No MCP fetch tools available"}
-
-                # Use the first available fetch tool
-                fetch_tool_name = fetch_tools[0]
              
                 # Prepare arguments for the MCP fetch tool
-                fetch_args = {"url": url}
-
-                # Try to add recursive flag if the tool supports it
-                fetch_args["max_length"] = 10000
-                fetch_args["html"] = True,
-                
-                fetch_args["include_links"] = True
-                fetch_args["include_tables"] = True
-                fetch_args["include_code"] = True
-                fetch_args["recursive"] = True
+                fetch_args = {"url": url, **_FETCH_ARGS_TEMPLATE}
 
                 # Execute the MCP fetch tool
                 result = await self._execute_tool(fetch_tool_name, fetch_args)
@@ -205,14 +699,19 @@ class GptService:
                     return {"error": f"MCP fetch failed: {result['error']}"}
                 # INSERT_YOUR_CODE
                 # Use tiktoken if available for accurate token counting, else fallback to word count
-                content = result.get("content", str(result))
-                try:
-                    import tiktoken
-                    enc = tiktoken.get_encoding("cl100k_base")
-                    token_count = len(enc.encode(content))
-                except Exception:
-                    # If tiktoken is not installed, do a rough word-based fallback
-                    token_count = len(content.split())
+                content = result.get("content")
+                if content is None:
+                    # Only stringify the whole result when there is no content field
+                    content = str(result)
+                if len(content) > 50_000:
+                    # Far past the extraction threshold - an estimate is enough
+                    token_count = len(content) // 4
+                else:
+                    try:
+                        token_count = len(_get_token_encoder().encode(content))
+                    except Exception:
+                        # If tiktoken is not installed, do a rough word-based fallback
+                        token_count = len(content.split())
              
                 # Count URLs processed (simple heuristic)
                 url_count = content.count("http://") + content.count("https://")
@@ -224,7 +723,7 @@ class GptService:
                 relevant_text = content
                 if token_count > 2000:
                     try: 
-                        relevant_text = extract_relevant_text(content, query,max_chars=1000, max_blocks=1000)
+                        relevant_text = _extract_relevant_text_cached(content, query)
                     except Exception as e:
                         relevant_text = "Failed to extract relevant text"
                 
@@ -238,9 +737,7 @@ class GptService:
                 }
 
             except Exception as e:
-                import traceback
-                print(f"Failed to fetch content: {e}")
-                traceback.print_exc()
+                logger.exception("Failed to fetch content: %s", e)
                 return {"error": f"Failed to fetch content: {str(e)}"}
         # Register the MCP fetch tool
         self._register_tool(
@@ -264,6 +761,15 @@ class GptService:
             tool_type="custom"
         )
 
+        pass  # Add your custom tools above this line
+
+    async def _register_agents(self):
+        """
+        Register agent tools
+
+        Agents copy tools from the registry when they are initialized, so this
+        must run after both MCP and custom tools are registered.
+        """
         from agent_registry import register_predefined_agents
 
         await register_predefined_agents(self, self.config)
@@ -292,75 +798,202 @@ class GptService:
         #     reasoning_effort="high"
         # )
 
-        pass  # Add your custom tools above this line
+    async def _mcp_dispatch(self, tool_name: str, args: dict) -> dict:
+        """Executor for every MCP tool - all calls go through the one shared MCP client"""
+        if self._mcp_client is None:
+            raise ValueError("MCP client is not initialized")
+        return await self._mcp_client.call_tool(tool_name, args)
 
-    async def _register_mcp_tools(self):
-        """Register tools from MCP gateway"""
+    async def _register_mcp_tools(self, use_snapshot: bool = False):
+        """
+        Register tools from MCP gateway
+
+        Args:
+            use_snapshot: Register from the MCP_TOOLS_SNAPSHOT file when it is
+                fresh and connect to the gateways in the background
+        """
         if not self.config.MCP_URLS:
             return
         try:
 
             # Initialize MCP client
-            self._mcp_client = SimpleMCPClient(self.config.MCP_URLS)
+            if self._mcp_client:
+                await self._mcp_client.__aexit__(None, None, None)
+            self._mcp_client = SimpleMCPClient(
+                self.config.MCP_URLS,
+                rate_limit=self.config.MCP_RATE_LIMIT,
+                rate_burst=self.config.MCP_RATE_BURST,
+                retries=self.config.MCP_RETRIES,
+                retry_base_delay=self.config.RETRY_BASE_DELAY,
+            )
+            self._mcp_client.on_tools_list_changed = self.invalidate_mcp_cache
             await self._mcp_client.__aenter__()
 
-            tools = await self._mcp_client.list_tools()
+            tools = self._load_mcp_tools_snapshot() if use_snapshot else None
+            if tools is None:
+                tools = await self._list_mcp_tools()
+            else:
+                if self.can_log:
+                    logger.info("💾 Registered %d MCP tools from snapshot", len(tools))
+                self._mcp_refresh_task = asyncio.create_task(self._refresh_mcp_tools(tools))
 
+            self._apply_mcp_tools(tools)
 
-            # Custom descriptions for MCP tools (emphasizing their capabilities)
-            TOOL_DESCRIPTION_OVERRIDES = {
-                "brave_web_search": (
-                    "Search the web and get rich summaries with current information. "
-                    "Returns a SUMMARY containing key facts, data, and details - not just links. "
-                    "For weather queries, the summary includes temperature and conditions. "
-                    "For stock prices, the summary includes current price. "
-                    "For news, the summary includes headlines and key points. "
-                    "READ THE SUMMARY carefully - it usually contains the answer you need."
-                ),
-                "fetch": (
-                    "Fetch the full content of a specific web page URL. "
-                    "Use this ONLY if brave_web_search summaries lack critical details. "
-                    "For simple queries (weather, stocks, news), the search summary is usually sufficient."
-                )
-            }
+        except Exception as e:
+            logger.error("❌ Failed to initialize MCP: %s", e)
+            # Don't raise - allow service to continue without MCP
 
-            # Register each MCP tool
-            for tool in tools:
-                tool_name = tool["name"]
+    def _apply_mcp_tools(self, tools: List[dict]):
+        """
+        Replace the MCP entries in the registry with tools returned by the gateways
 
-                # Create executor that calls MCP
-                async def mcp_executor(args: dict, tn=tool_name) -> dict:
-                    if self._mcp_client is None:
-                        raise ValueError("MCP client is not initialized")
-                    return await self._mcp_client.call_tool(tn, args)
+        The new registry is built aside and swapped in with one assignment, so
+        a concurrent turn sees either the old or the new MCP tools, never none.
+        """
+        # Custom descriptions for MCP tools (emphasizing their capabilities)
+        TOOL_DESCRIPTION_OVERRIDES = {
+            "brave_web_search": (
+                "Search the web and get rich summaries with current information. "
+                "Returns a SUMMARY containing key facts, data, and details - not just links. "
+                "For weather queries, the summary includes temperature and conditions. "
+                "For stock prices, the summary includes current price. "
+                "For news, the summary includes headlines and key points. "
+                "READ THE SUMMARY carefully - it usually contains the answer you need."
+            ),
+            "fetch": (
+                "Fetch the full content of a specific web page URL. "
+                "Use this ONLY if brave_web_search summaries lack critical details. "
+                "For simple queries (weather, stocks, news), the search summary is usually sufficient."
+            )
+        }
 
+        registry = {name: entry for name, entry in self._tool_registry.items() if entry.type != "mcp"}
+        # Use custom description if available, otherwise use MCP's description
+        registry.update({
+            tool["name"]: self._make_tool_entry(
+                tool["name"],
+                TOOL_DESCRIPTION_OVERRIDES.get(
+                    tool["name"],
+                    tool.get('description') or f'MCP tool: {tool["name"]}'
+                ),
                 # Filter input schema to only include allowed parameters
-                input_schema = tool.get('inputSchema', {})
-
-                # Use custom description if available, otherwise use MCP's description
-                description = TOOL_DESCRIPTION_OVERRIDES.get(
-                    tool_name,
-                    tool.get('description') or f'MCP tool: {tool_name}'
-                )
-
-                self._register_tool(
-                    name=tool_name,
-                    description=description,
-                    input_schema=input_schema,
-                    executor=mcp_executor,
-                    tool_type="mcp",
-                )
+                self._filter_tool_schema(tool["name"], tool.get('inputSchema', {})),
+                functools.partial(self._mcp_dispatch, tool["name"]),
+                "mcp",
+            )
+            for tool in tools
+        })
+        self._tool_registry = registry
+        self._registry_version += 1
+        self._mcp_tools_version += 1
+
+        self._primary_fetch_tool = next(
+            (
+                tool_name
+                for tool_name, tool_info in registry.items()
+                if tool_info.type == "mcp" and "fetch" in tool_name.lower()
+            ),
+            None,
+        )
 
-        except Exception as e:
-            print(f"❌ Failed to initialize MCP: {e}")
-            # Don't raise - allow service to continue without MCP
+    async def _refresh_mcp_tools(self, snapshot_tools: List[dict]):
+        """
+        Connect to the gateways and re-register MCP tools if they changed since the snapshot
+
+        Agents pick up the new tools on their next run (AgentTool._sync_mcp_tools).
+        """
+        async with self._mcp_relist_lock:
+            try:
+                tools = await self._list_mcp_tools()
+            except Exception as e:
+                logger.error("❌ Failed to refresh MCP tools: %s", e)
+                return
+
+            # No tools means no gateway answered - keep the snapshot, calls reconnect lazily
+            if tools and tools != snapshot_tools:
+                logger.info("🔁 MCP tools changed since snapshot - re-registering")
+                self._apply_mcp_tools(tools)
+
+    def _load_mcp_tools_snapshot(self) -> Optional[List[dict]]:
+        """Return the snapshotted MCP tool list, or None if there is no fresh snapshot for MCP_URLS"""
+        path = self.config.MCP_TOOLS_SNAPSHOT
+        if not path:
+            return None
+        try:
+            with open(path, "rb") as f:
+                snapshot = fast_json.loads(f.read())
+        except (OSError, fast_json.JSONDecodeError):
+            return None
+
+        if snapshot.get("gateway_urls") != list(self.config.MCP_URLS):
+            return None
+        if time.time() - snapshot.get("saved_at", 0) > self.config.MCP_TOOLS_SNAPSHOT_MAX_AGE:
+            return None
+        return snapshot.get("tools")
+
+    def _save_mcp_tools_snapshot(self, tools: List[dict]):
+        """Write the MCP tool list to MCP_TOOLS_SNAPSHOT for the next cold start"""
+        path = self.config.MCP_TOOLS_SNAPSHOT
+        if not path:
+            return
+        snapshot = {"gateway_urls": list(self.config.MCP_URLS), "saved_at": time.time(), "tools": tools}
+        try:
+            # Write then rename, so a concurrent reader never sees a partial file
+            with open(f"{path}.tmp", "wb") as f:
+                f.write(fast_json.dumps(snapshot))
+            os.replace(f"{path}.tmp", path)
+        except OSError as e:
+            logger.warning("⚠️  Could not write MCP tools snapshot: %s", e)
+
+    async def _list_mcp_tools(self) -> List[dict]:
+        """List MCP tools, reusing the previous result for MCP_TOOLS_TTL seconds"""
+        expiry, tools = self._mcp_tools_cache
+        now = time.monotonic()
+        if tools is not None and now < expiry:
+            return tools
+
+        tools = await self._mcp_client.list_tools()
+        self._mcp_tools_cache = (now + self.config.MCP_TOOLS_TTL, tools)
+        if tools:
+            self._save_mcp_tools_snapshot(tools)
+        return tools
+
+    async def invalidate_mcp_cache(self):
+        """
+        Drop the cached MCP tool list and re-register MCP tools from the gateways
+
+        Called by the MCP client when a gateway reports tools/list_changed. The
+        tools are re-listed over the existing client, which other calls keep
+        using. A burst of notifications runs at most one re-list at a time, plus
+        one queued behind it that picks up every change seen meanwhile.
+        """
+        self._mcp_tools_cache = (0.0, None)
+        if self._mcp_relist_queued:
+            return
+        self._mcp_relist_queued = True
+        async with self._mcp_relist_lock:
+            self._mcp_relist_queued = False
+            if self._mcp_client is None:
+                return
+            self._mcp_tools_cache = (0.0, None)
+            try:
+                tools = await self._list_mcp_tools()
+            except Exception as e:
+                logger.error("❌ Failed to re-list MCP tools: %s", e)
+                return
+            # No tools means no gateway answered - keep the current tools
+            if tools:
+                if self.can_log:
+                    logger.info("🔁 MCP tool list changed - re-registered %d tools", len(tools))
+                self._apply_mcp_tools(tools)
 
     def _filter_tool_schema(self, tool_name: str, schema: dict) -> dict:
         """
         Filter tool schema to only include allowed parameters
 
         This ensures the LLM only sees parameters we support,
-        preventing confusion from extra MCP parameters
+        preventing confusion from extra MCP parameters. Applied once when
+        MCP tools are registered; the registry stores the filtered schema.
 
         Args:
             tool_name: Name of the tool
@@ -402,24 +1035,65 @@ class GptService:
         Initialize all tools (MCP and custom)
         Call this once at startup
         """
+        if self.can_log:
+            logger.info("🔁 Event loop: %s", type(asyncio.get_running_loop()).__name__)
+
+        # Create the inference client first so agents registered below share it
+        self._get_http_client()
+
         # Skip tool initialization if tool calls are disabled
         if not self.config.ENABLE_TOOL_CALLS:
-            print("🚫 Tool calls disabled via ENABLE_TOOL_CALLS environment variable")
+            logger.info("🚫 Tool calls disabled via ENABLE_TOOL_CALLS environment variable")
+            self._tools_ready = True
             return
 
         
 
     
-        await self._register_mcp_tools()
-        # then register custom tools (they might depend on the mcp_tools)
-        await self._register_custom_tools()
+        # MCP discovery and custom tool registration are independent - custom
+        # tools look up MCP tools at call time, not at registration
+        await asyncio.gather(self._register_mcp_tools(use_snapshot=True), self._register_custom_tools())
+        # then register agents, which copy the mcp and custom tools
+        await self._register_agents()
+        self._tools_ready = True
 
     async def shutdown_tools(self):
         """Cleanup resources"""
+        if self._mcp_refresh_task is not None:
+            self._mcp_refresh_task.cancel()
+            self._mcp_refresh_task = None
         if self._mcp_client:
             await self._mcp_client.__aexit__(None, None, None)
             self._mcp_client = None
+        if self._blocking_pool:
+            self._blocking_pool.shutdown(wait=False, cancel_futures=True)
+            self._blocking_pool = None
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        self._tool_cache.clear()
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
         self._tool_registry.clear()
+        self._schema_intern.clear()
+        self._registry_version += 1
+        self._primary_fetch_tool = None
+        self._tools_ready = False
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled inference client, creating it on first use"""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=self.config.INFERENCE_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=self.config.INFERENCE_MAX_CONNECTIONS,
+                    max_keepalive_connections=self.config.INFERENCE_MAX_CONNECTIONS,
+                    keepalive_expiry=self.config.INFERENCE_KEEPALIVE_EXPIRY,
+                ),
+                # Multiplexes concurrent streams over one TLS connection to remote inference
+                http2=HTTP2_AVAILABLE and self.config.INFERENCE_HTTP2,
+            )
+        return self._http
 
     # ------------------------------------------------------------------------
     # Tool Execution
@@ -432,44 +1106,140 @@ class GptService:
         Returns:
             dict with 'content' or 'error' key
         """
-        import time
         start_time = time.time()
 
         if tool_name not in self._tool_registry:
             error_result = {"error": f"Tool '{tool_name}' not found"}
-            self._track_tool_call(tool_name, arguments, error_result, time.time() - start_time)
+            self._track_tool_call({
+                "tool_name": tool_name,
+                "arguments": arguments,
+                "result": error_result,
+                "execution_time": time.time() - start_time,
+            })
             return error_result
 
+        tool_info = self._tool_registry[tool_name]
+
+        # Reject malformed arguments locally instead of paying for an executor round-trip
+        validator = tool_info.validator
+        if validator is not None:
+            validation_error = validator(arguments)
+            if validation_error is not None:
+                error_result = {"error": f"Invalid arguments for tool '{tool_name}': {validation_error}"}
+                self._track_tool_call({
+                    "tool_name": tool_name,
+                    "arguments": arguments,
+                    "result": error_result,
+                    "execution_time": time.time() - start_time,
+                })
+                return error_result
+
         # Emit tool call start event
         self.event_emitter.emit("tool_call_start", {
             "tool_name": tool_name,
             "arguments": arguments
         })
 
+        # Serve repeat calls to idempotent tools from the result cache
+        cache_ttl = tool_info.cache_ttl
+        semantic_entry = None
+        if cache_ttl:
+            cache_key = hashlib.sha256(
+                (tool_name + json.dumps(arguments, sort_keys=True, separators=(",", ":"))).encode()
+            ).hexdigest()
+            hit_key = cache_key
+            cached = self._tool_cache.get(cache_key)
+            now = time.monotonic()
+
+            # No exact match - look for an earlier call with a near-identical query
+            if (cached is None or cached[0] <= now) and self._semantic_cache is not None:
+                try:
+                    split = self._semantic_cache.split_arguments(tool_name, arguments)
+                    if split is not None:
+                        group, query = split
+                        embedding = await asyncio.get_running_loop().run_in_executor(
+                            None, self._semantic_cache.embed, query
+                        )
+                        semantic_entry = (group, embedding)
+                        similar_key = self._semantic_cache.lookup(group, embedding)
+                        if similar_key is not None:
+                            hit_key = similar_key
+                            cached = self._tool_cache.get(similar_key)
+                except Exception as e:
+                    # The semantic cache is an optimization - never fail the tool call over it
+                    logger.warning("⚠️  Semantic cache lookup failed for %s: %s", tool_name, e)
+                    semantic_entry = None
+
+            if cached is not None and cached[0] > now:
+                self._tool_cache.move_to_end(hit_key)
+                # Shallow copy so callers annotating the result don't alter the cached entry
+                result = dict(cached[1])
+                tool_call_record = {
+                    "tool_name": tool_name,
+                    "arguments": arguments,
+                    "result": result,
+                    "execution_time": 0.0,
+                    "cached": True,
+                }
+                self._track_tool_call(tool_call_record)
+                self.event_emitter.emit("tool_call_complete", tool_call_record)
+                return result
+
+            # Share the result of an identical call that is already running
+            inflight = self._tool_inflight.get(cache_key)
+            if inflight is not None:
+                result = await self._await_inflight(inflight)
+                if result is not None:
+                    tool_call_record = {
+                        "tool_name": tool_name,
+                        "arguments": arguments,
+                        "result": result,
+                        "execution_time": time.time() - start_time,
+                        "cached": True,
+                    }
+                    self._track_tool_call(tool_call_record)
+                    self.event_emitter.emit("tool_call_complete", tool_call_record)
+                    return result
+
+            inflight = asyncio.get_running_loop().create_future()
+            self._tool_inflight[cache_key] = inflight
+
         try:
-            tool_info = self._tool_registry[tool_name]
-            executor = tool_info["executor"]
-            result = await executor(arguments)
-            execution_time = time.time() - start_time
+            result = await self._run_executor(tool_info, arguments)
 
-            # Track the successful tool call
-            self._track_tool_call(tool_name, arguments, result, execution_time)
+            # Agents report failures through "status" rather than an "error" key
+            if cache_ttl and isinstance(result, dict) and "error" not in result and result.get("status") != "error":
+                self._store_tool_result(cache_key, dict(result), cache_ttl)
+                if semantic_entry is not None:
+                    self._semantic_cache.add(*semantic_entry, cache_key)
+                inflight.set_result(dict(result))
 
-            # Emit tool call complete event
-            self.event_emitter.emit("tool_call_complete", {
+            # One payload serves as both the history record and the completion event
+            tool_call_record = {
                 "tool_name": tool_name,
                 "arguments": arguments,
-                "result": result
-            })
+                "result": result,
+                "execution_time": time.time() - start_time,
+            }
+
+            # Track the successful tool call
+            self._track_tool_call(tool_call_record)
+
+            # Emit tool call complete event
+            self.event_emitter.emit("tool_call_complete", tool_call_record)
 
             return result
 
         except Exception as e:
-            execution_time = time.time() - start_time
             error_result = {"error": f"Tool execution failed: {str(e)}"}
 
             # Track the failed tool call
-            self._track_tool_call(tool_name, arguments, error_result, execution_time)
+            self._track_tool_call({
+                "tool_name": tool_name,
+                "arguments": arguments,
+                "result": error_result,
+                "execution_time": time.time() - start_time,
+            })
 
             # Emit tool call error event
             self.event_emitter.emit("tool_call_error", {
@@ -480,53 +1250,127 @@ class GptService:
 
             return error_result
 
+        finally:
+            if cache_ttl:
+                self._tool_inflight.pop(cache_key, None)
+                # Failed or cancelled - callers waiting on this run execute the tool themselves
+                if not inflight.done():
+                    inflight.cancel()
+
+    async def _run_executor(self, tool_info: ToolEntry, arguments: dict):
+        """
+        Run a tool's executor within its per-tool limit and the shared limit
+
+        Calls over a limit wait for a slot rather than failing. Agents are
+        exempt from the shared limit: they call leaf tools themselves, and
+        holding a slot while waiting for one could deadlock.
+        """
+        limiter = tool_info.limiter
+        shared = self._tool_semaphore if tool_info.type != "agent" else None
+
+        if limiter is not None:
+            await limiter.acquire()
+        try:
+            if shared is None:
+                return await tool_info.executor(arguments)
+            async with shared:
+                return await tool_info.executor(arguments)
+        finally:
+            if limiter is not None:
+                limiter.release()
+
+    @staticmethod
+    async def _await_inflight(inflight: asyncio.Future) -> Optional[dict]:
+        """Wait for an identical running tool call; None if it did not succeed"""
+        try:
+            # Shielded so a cancelled waiter doesn't cancel the shared call
+            result = await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if not inflight.cancelled():
+                raise
+            return None
+        return dict(result)
+
+
+
 
 
+    def _store_tool_result(self, cache_key: str, result: dict, ttl: int):
+        """Cache a successful tool result, evicting expired then least recently used entries when full"""
+        now = time.monotonic()
+        self._tool_cache[cache_key] = (now + ttl, result)
+        self._tool_cache.move_to_end(cache_key)
 
+        if len(self._tool_cache) > self.config.TOOL_CACHE_SIZE:
+            for key in [key for key, (expiry, _) in self._tool_cache.items() if expiry <= now]:
+                del self._tool_cache[key]
+            while len(self._tool_cache) > self.config.TOOL_CACHE_SIZE:
+                self._tool_cache.popitem(last=False)
 
-    def _get_permitted_tools_for_llm(self, permitted_tools: List[str]) -> List[dict]:
+    def _get_permitted_tools_for_llm(self, permitted_tools: Sequence[str]) -> List[dict]:
         """
         Get tool definitions in OpenAI function calling format
         Only includes permitted tools
+
+        Results are memoized per permitted tool list until the registry changes.
         """
-        tools = []
+        return self._get_permitted_tools_entry(permitted_tools)[0]
+
+    def _get_permitted_tools_entry(self, permitted_tools: Sequence[str]) -> Tuple[List[dict], Optional[bytes]]:
+        """Permitted tools in OpenAI format plus their JSON encoding (None when empty)"""
+        cache_key = (self._registry_version, tuple(permitted_tools))
+        entry = self._tools_for_llm_cache.get(cache_key)
+        if entry is not None:
+            return entry
 
+        tools = []
         for tool_name in permitted_tools:
-            if tool_name not in self._tool_registry:
+            tool_info = self._tool_registry.get(tool_name)
+            if tool_info is None:
                 continue
 
-            tool_info = self._tool_registry[tool_name]
-            input_schema = tool_info.get("input_schema", {})
-
             # Only include tools with valid schemas
-            if input_schema and "properties" in input_schema:
-                tools.append(
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": tool_name,
-                            "description": tool_info.get(
-                                "description", f"Tool: {tool_name}"
-                            ),
-                            "parameters": input_schema,
-                        },
-                    }
-                )
-        return tools
+            openai_spec = tool_info.openai_spec
+            if openai_spec is not None:
+                tools.append(openai_spec)
 
-    def get_chat_completion_params(self) -> tuple:
-        headers = {}
-        if self.config.REMOTE_INFERENCE_KEY:
-            headers["Authorization"] = f"Bearer {self.config.REMOTE_INFERENCE_KEY}"
+        entry = (tools, fast_json.dumps(tools) if tools else None)
+        if len(self._tools_for_llm_cache) >= 32:
+            self._tools_for_llm_cache.clear()
+        self._tools_for_llm_cache[cache_key] = entry
+        return entry
+
+    def _cache_prompt(self) -> bool:
+        """
+        Whether to ask the inference server to reuse its cached prompt prefix
+
+        Each tool round re-sends the whole conversation with only new messages
+        appended, so the local llama.cpp server can skip prefill for everything
+        it has already seen. Remote OpenAI-compatible APIs may reject the
+        unknown field, so it is only sent to local inference.
+        """
+        return self.config.INFERENCE_CACHE_PROMPT and not self.config.USE_REMOTE_INFERENCE
 
-        if self.config.USE_REMOTE_INFERENCE:
-            url = self.config.REMOTE_INFERENCE_URL
-            model = self.config.OPENAI_MODEL
-        else:
-            url = self.config.INFERENCE_URL
-            model = "gpt-3.5-turbo"
+    async def _throttle_inference(self, url: str):
+        """Wait for the inference endpoint's rate limit (INFERENCE_RATE_LIMIT), if any"""
+        bucket = get_bucket(url, self.config.INFERENCE_RATE_LIMIT, self.config.INFERENCE_RATE_BURST)
+        if bucket is not None:
+            await bucket.acquire()
 
-        return headers, model, url
+    def get_chat_completion_params(self) -> tuple:
+        """
+        (headers, model, url) for chat completion requests
+
+        The headers include the JSON Content-Type and are shared between
+        calls - treat them as read-only.
+        """
+        return _chat_completion_params(
+            self.config.REMOTE_INFERENCE_KEY,
+            self.config.USE_REMOTE_INFERENCE,
+            self.config.REMOTE_INFERENCE_URL,
+            self.config.OPENAI_MODEL,
+            self.config.INFERENCE_URL,
+        )
 
     # ------------------------------------------------------------------------
     # Message Preparation
@@ -552,21 +1396,32 @@ class GptService:
         if not system_prompt:
             return messages
 
-        # Check if there's already a system message
-        has_system = any(msg.get("role") == "system" for msg in messages)
-
-        if not has_system:
-            # Add system prompt at the beginning
-            return [{"role": "system", "content": system_prompt}] + messages
-        else:
-            # Replace existing system message
-            result_messages = []
-            for msg in messages:
-                if msg.get("role") == "system":
-                    result_messages.append({"role": "system", "content": system_prompt})
-                else:
-                    result_messages.append(msg)
-            return result_messages
+        # By convention the system message, if any, is the first message
+        first = messages[0] if messages else None
+        if first is not None and first.get("role") == "system":
+            if first.get("content") == system_prompt:
+                return messages
+            return [{"role": "system", "content": system_prompt}, *messages[1:]]
+
+        # Add system prompt at the beginning
+        return [{"role": "system", "content": system_prompt}, *messages]
+
+    @staticmethod
+    def _add_premise_hint(messages: List[dict]) -> List[dict]:
+        """
+        Point out a known false premise in the latest user question.
+
+        The note is sent as its own system message just before that question,
+        so the system prompt and the earlier turns - the prefix the inference
+        server reuses between requests - stay unchanged.
+        """
+        last = messages[-1] if messages else None
+        if last is None or last.get("role") != "user" or not isinstance(last.get("content"), str):
+            return messages
+        hint = premise_hint(last["content"])
+        if not hint:
+            return messages
+        return [*messages[:-1], {"role": "system", "content": hint}, last]
 
     # ------------------------------------------------------------------------
     # Non-Streaming Chat
@@ -589,24 +1444,39 @@ class GptService:
         )
 
         headers, model, url = self.get_chat_completion_params()
-        print(f"🔍 agent_name:  conversation: {conversation}")
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
+        if self.can_log:
+            logger.debug("🔍 conversation: %s", conversation)
+
+        request_data = {
+            "messages": conversation,
+            "temperature": 1.0,
+            "top_p": 1.0,
+            "max_tokens": self.config.MAX_TOKENS,
+            "stream": False,
+            "model": model,
+            "reasoning_effort": reasoning_effort,
+        }
+
+        body = fast_json.dumps(request_data)
+
+        async def post():
+            await self._throttle_inference(url)
+            response = await self._get_http_client().post(
                 f"{url}/v1/chat/completions",
-                json={
-                    "messages": conversation,
-                    "temperature": 1.0,
-                    "top_p": 1.0,
-                    "max_tokens": self.config.MAX_TOKENS,
-                    "stream": False,
-                    "model": model,
-                    "reasoning_effort": "medium",
-                },
+                content=body,
                 headers=headers,
-                timeout=self.config.INFERENCE_TIMEOUT,
             )
-
-        result = response.json()
+            if response.status_code in RETRYABLE_STATUS:
+                response.raise_for_status()
+            return response
+
+        response = await with_retry(
+            post,
+            retries=self.config.INFERENCE_RETRIES,
+            base_delay=self.config.RETRY_BASE_DELAY,
+            label="LLM request",
+        )
+        result = fast_json.loads(response.content)
 
         # Validate response structure
         if "choices" not in result or not result["choices"]:
@@ -626,292 +1496,247 @@ class GptService:
     # Streaming Chat with Tool Calling
     # ------------------------------------------------------------------------
 
-    async def stream_chat_request(
+    async def _llm_stream(
         self,
-        messages: List[dict],
-        permitted_tools: List[str],
+        msgs: List[dict],
+        *,
+        tools_for_llm: List[dict],
+        tools_json: Optional[bytes] = None,
+        include_tools: bool = True,
         reasoning_effort: str = "low",
-        agent_name: str = "orchestrator",
-        agent_prompt: str = "",
     ):
         """
-        Stream chat request with tool calling support
+        Make a single streaming LLM call
+
+        Args:
+            msgs: Messages to send
+            tools_for_llm: Tool definitions offered to the LLM
+            tools_json: tools_for_llm already serialized to JSON, so the tool
+                schemas are not re-encoded on every tool-calling round
+            include_tools: If False, make the final synthesis call - tools are still
+                listed but tool_choice is "none"
+            reasoning_effort: Effort for tool-calling rounds; final synthesis uses "low"
 
         Yields:
-            str: Content chunks to stream to client
+            dict: Parsed SSE chunks from the inference server
         """
-        # Initialize tools if not already done and tool calls are enabled
-        if self.config.ENABLE_TOOL_CALLS and not self._tool_registry:
-            await self.init_tools()
-
-        conversation = self.prepare_conversation_messages(messages, reasoning_effort, agent_prompt)
         headers, model, url = self.get_chat_completion_params()
 
-        # Get permitted tools for this request (only if tool calls are enabled)
-        tools_for_llm = []
-        if self.config.ENABLE_TOOL_CALLS:
-            tools_for_llm = self._get_permitted_tools_for_llm(permitted_tools)
+        if not tools_for_llm:
+            tools_json = None
+        elif tools_json is None:
+            tools_json = fast_json.dumps(tools_for_llm)
 
-        async def llm_stream_once(msgs: List[dict], use_increased_tokens: bool = False):
-            """Make a single streaming LLM call
+        if self.can_log:
+            if not include_tools:
+                logger.info("📤 Final synthesis request")
+            else:
+                logger.info("📤 Sending request with %d messages", len(msgs))
+
+        # Only the conversation is encoded per call; the other fields are pre-encoded
+        body = b'{"messages":' + fast_json.dumps(msgs) + _encode_request_tail(
+            model, not include_tools, tools_json, self._cache_prompt(), reasoning_effort
+        )
 
-            Args:
-                msgs: Messages to send
-                use_increased_tokens: If True, use increased max_tokens for tool-calling scenarios
-            """
-            # Priority 1 Fix: Increase max_tokens for multi-tool scenarios to prevent stream termination
-            # Check if conversation has tool calls (indicates multi-tool scenario)
-            max_tokens_to_use = self.config.MAX_TOKENS
+        client = self._get_http_client()
 
-            has_tool_calls = any(
-                msg.get("role") == "assistant" and "tool_calls" in msg
-                for msg in msgs
+        async def open_stream() -> httpx.Response:
+            await self._throttle_inference(url)
+            resp = await client.send(
+                client.build_request(
+                    "POST",
+                    f"{url}/v1/chat/completions",
+                    headers=headers,
+                    content=body,
+                ),
+                stream=True,
             )
+            if resp.status_code in RETRYABLE_STATUS:
+                await resp.aclose()
+                resp.raise_for_status()
+            return resp
 
-            if has_tool_calls or use_increased_tokens:
-                max_tokens_to_use = min(4000, self.config.MAX_TOKENS * 4)
-                if self.can_log:
-                    print(f"⚡ Using increased max_tokens: {max_tokens_to_use} (multi-tool scenario detected)")
-
-            request_data = {
-                "messages": msgs, 
-                "max_tokens": 32767,
-                "max_output_tokens": 32767,
-                "stream": True,
-                "model": model,
-                "reasoning_effort": "low",
-                "temperature": .9,
-            }
-       
+        try:
+            # Only opening the stream is retried - once chunks are yielded, errors surface
+            resp = await with_retry(
+                open_stream,
+                retries=self.config.INFERENCE_RETRIES,
+                base_delay=self.config.RETRY_BASE_DELAY,
+                label="LLM stream",
+            )
+            async with contextlib.aclosing(resp):
+                # Handle HTTP errors
+                if resp.status_code != 200:
+                    error_body = await resp.aread()
+                    logger.error(
+                        "LLM request failed with status %d: %s",
+                        resp.status_code,
+                        error_body[:512].decode(errors='replace'),
+                    )
+
+                    # Parse error details if JSON (diagnostics only)
+                    if self.can_log:
+                        try:
+                            error_json = fast_json.loads(error_body)
+                            error_msg = error_json.get("message", "")
+                            if "context" in error_msg.lower():
+                                logger.warning("⚠️  Context limit exceeded - %d messages may be too many", len(msgs))
+                        except (fast_json.JSONDecodeError, AttributeError):
+                            pass
+
+                    raise httpx.HTTPStatusError(
+                        f"LLM request failed with status {resp.status_code}",
+                        request=resp.request,
+                        response=resp
+                    )
+
+                # Stream response
+                async for data in _iter_sse_data(resp):
+                    try:
+                        payload = _parse_sse_frame(data)
+
+                        yield payload
+                    except fast_json.JSONDecodeError:
+                        continue
+
+        except httpx.HTTPStatusError:
+            raise  # Re-raise HTTP errors
+        except Exception as e:
+            if self.can_log:
+                logger.exception("❌ Exception in LLM streaming: %s", e)
+            else:
+                logger.error("❌ Exception in LLM streaming: %s", e)
+            raise
 
-            # Add tools if available
-            print(f"tools_for_llm: {tools_for_llm}")
-            if tools_for_llm:
-                request_data["tools"] = tools_for_llm
-                request_data["tool_choice"] = "auto"
-                if self.can_log:
-                    tool_names = [tool.get("function", {}).get("name", "unknown") for tool in tools_for_llm]
-                    print(f"🛠️  Tools: {', '.join(tool_names)}")
+    async def stream_chat_request(
+        self,
+        messages: List[dict],
+        permitted_tools: Sequence[str],
+        reasoning_effort: str = "low",
+        agent_name: str = "orchestrator",
+        agent_prompt: str = "",
+    ):
+        """
+        Stream chat request with tool calling support
 
+        Yields:
+            str: Content chunks to stream to client
+        """
+        # Services are normally initialized at startup; this only covers standalone use
+        if self.config.ENABLE_TOOL_CALLS and not self._tools_ready:
+            # Concurrent first requests wait for one initialization instead of each running it
+            async with self._init_lock:
+                if not self._tools_ready:
+                    logger.warning("⚠️  init_tools() was not called at startup - initializing on first request")
+                    await self.init_tools()
 
-            
-            
-            if self.can_log:
-                print(f"📤 Sending request with {len(msgs)} messages")
+        conversation = self.prepare_conversation_messages(messages, reasoning_effort, agent_prompt)
+        if agent_name == "orchestrator":
+            conversation = self._add_premise_hint(conversation)
 
-            try:
-                async with httpx.AsyncClient(
-                    timeout=self.config.INFERENCE_TIMEOUT
-                ) as client:
-                    async with client.stream(
-                        "POST",
-                        f"{url}/v1/chat/completions",
-                        headers=headers,
-                        json=request_data,
-                        timeout=self.config.INFERENCE_TIMEOUT,
-                    ) as resp:
-                        # Handle HTTP errors
-                        if resp.status_code != 200:
-                            error_body = await resp.aread()
-                            error_text = error_body.decode(errors='replace')
-                            print(f"error text {error_text}")
-
-                            # Parse error details if JSON
-                            try:
-                                error_json = json.loads(error_text)
-                                print(f"Error text: {error_text}")
-                                error_msg = error_json.get("message", error_text)
-                                if "context" in error_msg.lower():
-                                    print(f"⚠️  Context limit exceeded - {len(msgs)} messages may be too many")                                
-                            except json.JSONDecodeError:
-                                pass
-
-                            raise httpx.HTTPStatusError(
-                                f"LLM request failed with status {resp.status_code}",
-                                request=resp.request,
-                                response=resp
-                            )
-
-                        # Stream response
-                        async for line in resp.aiter_lines():
-                            if not line or not line.startswith("data: "):
-                                continue
-
-                            if "[DONE]" in line:
-                                break
-
-                            try:
-                                payload = json.loads(line[6:]) 
-
-                                yield payload
-                            except json.JSONDecodeError:
-                                continue
-
-            except httpx.HTTPStatusError:
-                raise  # Re-raise HTTP errors
-            except Exception as e:
-                print(f"❌ Exception in LLM streaming: {e}")
-                if self.can_log:
-                    import traceback
-                    traceback.print_exc()
-                raise
+        # Get permitted tools for this request (only if tool calls are enabled)
+        # Tool schemas are identical on every round and are encoded once per tool set
+        tools_for_llm, tools_json = [], None
+        if self.config.ENABLE_TOOL_CALLS:
+            tools_for_llm, tools_json = self._get_permitted_tools_entry(permitted_tools)
+        llm_stream_once = functools.partial(
+            self._llm_stream,
+            tools_for_llm=tools_for_llm,
+            tools_json=tools_json,
+            reasoning_effort=reasoning_effort,
+        )
 
         # Main tool calling loop
         tool_call_count = 0
-        print(f"🚀 Starting chat request with MAX_TOOL_CALLS={MAX_TOOL_CALLS}")
+        if self.can_log:
+            logger.info("🚀 Starting chat request with MAX_TOOL_CALLS=%d", MAX_TOOL_CALLS)
+            # The tool set is the same on every round, so it is logged once per request
+            if tools_for_llm:
+                logger.info("🛠️  Tools: %s", ", ".join(tool["function"]["name"] for tool in tools_for_llm))
         
         # Reset tool call tracking for this conversation
         self.reset_tool_call_tracking()
 
-        exited_via_stop = False
-
-        while tool_call_count < MAX_TOOL_CALLS:
-           
-
-            # Process one LLM response and handle tool calls
-            async for content_chunk, status in process_llm_response_with_tools(
-                self._execute_tool, llm_stream_once, conversation, agent_name
-            ):
-                # Stream content to client if available
-                if content_chunk:
+        # Without tools there is nothing for the tool loop to do - relay the stream directly
+        if not tools_for_llm:
+            async with contextlib.aclosing(stream_llm_response(llm_stream_once, conversation)) as chunks:
+                async for content_chunk in chunks:
                     yield content_chunk
-                # Check status
-                if status == "stop":  # Normal completion or error
-                    exited_via_stop = True
-                    break  # Exit inner loop to trigger final synthesis
-                elif status == "continue":  # Tool calls executed, continue loop
-                    tool_call_count += 1
-                    print(f"🔧 Tool call #{tool_call_count} completed")
-                    break  # Exit the inner loop to continue the outer loop
-                elif status == "empty":
-                    break
-
-            # If we got a stop status, exit the tool-calling loop
-            if exited_via_stop:
-                break
-
-        # If we made tool calls and need to synthesize, do final synthesis
-        # ONLY synthesize if MAX_TOOL_CALLS was reached (tool_call_count >= MAX_TOOL_CALLS)
-        if tool_call_count >= MAX_TOOL_CALLS:
-            print(f"⚠️  MAX_TOOL_CALLS ({MAX_TOOL_CALLS}) reached. Making final synthesis call.")
-
-            # For final synthesis, use the full conversation but with updated system prompt
-            final_conversation = []
-            for msg in conversation:
-                if msg.get("role") == "system":
-                    # Replace system prompt for final synthesis
-                    final_conversation.append({
-                        "role": "system",
-                        "content": """You are Geist AI. The user asked a question and you've gathered information.
-                        YOU NO LONGER HAVE ACCESS TO TOOLS.
-
-Now provide a clear, complete answer to their the context you have. Include relevant facts, data, and citations. Be direct and helpful.
+            return
 
-CRITICAL - Handle Contradictions:
-- If the search results show information that contradicts the user's question (e.g., they ask for 'president' but the country has 'prime minister'), CLARIFY the distinction in your answer.
-- If a title or term in the question doesn't match reality, explain what the correct term is and provide the accurate information.
-- Example: If asked "who is the president of Spain", clarify that Spain has a Prime Minister (not a president) and provide both the Prime Minister's name and the King's name.
-- Never use the following formatting: |, ---, or any advanced markdown features in your responses.
+        # Each round streams one LLM response and ends in a single status:
+        # CONTINUE (tools ran, ask again), EMPTY (no answer, retry the round)
+        # or STOP (done). Empty rounds are counted across retries so the
+        # MAX_FAILED_COMPLETIONS limit in process_llm_response_with_tools holds.
+        empty_rounds = 0
+        while tool_call_count < MAX_TOOL_CALLS:
+            status = STOP
+            async with contextlib.aclosing(process_llm_response_with_tools(
+                self._execute_tool,
+                llm_stream_once,
+                conversation,
+                agent_name,
+                parallel=self.enable_parallel_tool_execution,
+                failed_completions=empty_rounds,
+            )) as round_items:
+                async for item in round_items:
+                    # Content chunks are dicts; anything else is a status sentinel
+                    if item.__class__ is dict:
+                        yield item
+                    else:
+                        status = item
+                        break
 
-Important: This is your FINAL response to the user - make it complete, accurate, and actionable."""
-                    })
-                else:
-                    final_conversation.append(msg)
-
-            # Create a tool-free version of llm_stream_once for the final call
-            async def llm_stream_final(msgs: List[dict]):
-                """Final LLM call without tools"""
-                request_data = {
-                "messages": msgs,
-                "max_tokens": 32767,
-                "max_output_tokens": 32767,
-                "top_p": 1.0,
-                "temperature": .9,
-                "reasoning_effort": "medium",                
-                "stream": True,
-                "model": model,
-                "tool_choice": "none",
-            }  
+            if status is STOP:  # Normal completion or error
+                return
+            if status is CONTINUE:  # Tool calls executed, ask the LLM again
+                tool_call_count += 1
                 if self.can_log:
-                    print(f"📤 Final synthesis request")
+                    logger.info("🔧 Tool call #%d completed", tool_call_count)
+            elif status is EMPTY:  # No answer - retry the LLM call
+                empty_rounds += 1
+            else:
+                logger.warning("⚠️  Unexpected round status %s, stopping", status)
+                return
+
+        # Only synthesize once MAX_TOOL_CALLS was reached
+        if self.can_log:
+            logger.info("⚠️  MAX_TOOL_CALLS (%d) reached. Making final synthesis call.", MAX_TOOL_CALLS)
 
-                try:
-                    async with httpx.AsyncClient(timeout=self.config.INFERENCE_TIMEOUT) as client:
-                        async with client.stream(
-                            "POST",
-                            f"{url}/v1/chat/completions",
-                            headers=headers,
-                            json=request_data,
-                            
-                            timeout=self.config.INFERENCE_TIMEOUT
-                        ) as resp:
-                            if resp.status_code != 200:
-                                raise httpx.HTTPStatusError(
-                                    f"Final synthesis failed with status {resp.status_code}",
-                                    request=resp.request,
-                                    response=resp
-                                )
-
-                            async for line in resp.aiter_lines():
-                                if not line or not line.startswith("data: "):
-                                    continue
-                                if "[DONE]" in line:
-                                    break
-                                try:
-                                    payload = json.loads(line[6:])
-                                    yield payload
-                                except json.JSONDecodeError:
-                                    continue
+        # For final synthesis, keep the conversation prefix intact and append the instruction
+        final_conversation = [*conversation, FINAL_USER_MSG]
 
-                except Exception as e:
-                    if self.can_log:
-                        import traceback
-                        traceback.print_exc()
-                    raise
-
-            # Use process_llm_response_with_tools for proper streaming and handling
-            final_synthesis_content = []
-            async def stream_with_retry(retry_count=0, max_retries=10):
-                """Helper to stream responses with retry on empty status (max 3 retries)"""
-                if retry_count > max_retries:
-                    print(f"⚠️  Max retries ({max_retries}) exceeded, stopping")
-                    return
-                
-                async for content_chunk, status in process_llm_response_with_tools(
-                    self._execute_tool,
-                    llm_stream_final,
-                    final_conversation,
-                    agent_name + "_final"
-                ):
-                    if content_chunk:
-                        yield content_chunk, status
-                    elif status == "empty":
-                        # Recursively retry with incremented counter
-                        print(f"🔄 Retrying process_llm_response_with_tools (attempt {retry_count + 1}/{max_retries})")
-                        async for retry_chunk, retry_status in stream_with_retry(retry_count + 1, max_retries):
-                            yield retry_chunk, retry_status
-                        return
-                    else:
-                        yield content_chunk, status
+        # Final call lists the same tools (tool_choice "none") so the prefix matches
+        llm_stream_final = functools.partial(
+            self._llm_stream,
+            tools_for_llm=tools_for_llm,
+            tools_json=tools_json,
+            include_tools=False,
+        )
 
-            async for content_chunk, status in stream_with_retry():
-                if content_chunk:
-                    final_synthesis_content.append(content_chunk)
-                    yield content_chunk
-                
-                
-                if status == "stop":
+        # A "_final" round never retries - an empty answer ends in STOP
+        async with contextlib.aclosing(process_llm_response_with_tools(
+            self._execute_tool,
+            llm_stream_final,
+            final_conversation,
+            agent_name + "_final",
+        )) as round_items:
+            async for item in round_items:
+                if item.__class__ is dict:
+                    yield item
+                    continue
+
+                if item is not STOP:
+                    # Tools can't be called with tool_choice "none", but handle it
+                    logger.warning("⚠️  Unexpected %s in final synthesis, stopping", item)
+                elif self.can_log:
                     # Print tool call statistics at the end
-                    if self.can_log:
-                        stats = self.get_tool_call_statistics()
-                        print(f"\n📊 Tool Call Statistics:")
-                        print(f"   Total calls: {stats['total_calls']}")
-                        print(f"   Success rate: {stats['success_rate']:.1f}%")
-                        print(f"   Average execution time: {stats['average_execution_time']:.2f}s")
-                        if stats['tool_usage']:
-                            print(f"   Tool usage: {stats['tool_usage']}")
-                    return
-                elif status == "continue":
-                    # This shouldn't happen in final synthesis (no tools), but handle it
-                    print(f"⚠️  Unexpected 'continue' in final synthesis, stopping")
-                    return
+                    stats = self.get_tool_call_statistics()
+                    logger.info(
+                        "📊 Tool Call Statistics: total calls=%d, success rate=%.1f%%, average execution time=%.2fs, tool usage=%s",
+                        stats["total_calls"],
+                        stats["success_rate"],
+                        stats["average_execution_time"],
+                        stats["tool_usage"],
+                    )
+                return
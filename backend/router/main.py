@@ -8,8 +8,11 @@ from typing import List, Optional
 import httpx
 import asyncio
 import json
+import fast_json
 import logging
+import logging.handlers
 import os
+import queue
 import config
 from gpt_service import GptService
 from nested_orchestrator import NestedOrchestrator
@@ -21,7 +24,14 @@ from whisper_client import WhisperSTTClient
 
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+# Records are pushed onto a queue and written by a background listener thread,
+# so logging from request handlers never blocks the event loop on stdout/stderr
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
 
@@ -77,6 +87,17 @@ logger.info(f"Whisper STT client initialized with service URL: {whisper_service_
 
 gpt_service_instance: GptService | None = None
 
+# Shared client for the memory and embeddings proxies, so connections are kept alive
+proxy_client: httpx.AsyncClient | None = None
+
+
+def get_proxy_client() -> httpx.AsyncClient:
+    """Return the pooled proxy client, creating it on first use"""
+    global proxy_client
+    if proxy_client is None:
+        proxy_client = httpx.AsyncClient()
+    return proxy_client
+
 
 async def get_gpt_service():
     """
@@ -99,7 +120,16 @@ async def get_gpt_service():
 
     # Copy the tool registry from the initialized instance
     new_service._tool_registry = gpt_service_instance._tool_registry.copy()
+    new_service._tools_ready = gpt_service_instance._tools_ready
     new_service._mcp_client = gpt_service_instance._mcp_client
+    new_service._http = gpt_service_instance._http
+    new_service._tool_cache = gpt_service_instance._tool_cache
+    new_service._tool_semaphore = gpt_service_instance._tool_semaphore
+    new_service._tool_inflight = gpt_service_instance._tool_inflight
+    new_service._semantic_cache = gpt_service_instance._semantic_cache
+    # The registry copy is never modified, so memoized tool lists stay valid
+    new_service._registry_version = gpt_service_instance._registry_version
+    new_service._tools_for_llm_cache = gpt_service_instance._tools_for_llm_cache
 
     return new_service
 
@@ -111,6 +141,18 @@ async def startup_event():
     logger.info("Server startup complete - GptService initialized")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release GptService resources and flush queued log records on server shutdown"""
+    logger.info("Server shutting down")
+    if gpt_service_instance is not None:
+        await gpt_service_instance.shutdown_tools()
+    if proxy_client is not None:
+        await proxy_client.aclose()
+    await stt_service.aclose()
+    _log_listener.stop()
+
+
 @app.get("/health")
 def health_check():
     """Health check endpoint."""
@@ -178,7 +220,8 @@ def create_nested_research_system(config):
 @app.post("/api/chat")
 async def chat_with_orchestrator(chat_request: ChatRequest):
     """Non-streaming chat endpoint for simple requests"""
-    print(f"[Backend] Received chat request: {chat_request.model_dump_json(indent=2)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[Backend] Received chat request: %s", chat_request.model_dump_json(indent=2))
 
     # Build messages array with conversation history
     if chat_request.messages:
@@ -254,16 +297,13 @@ Use this context to provide more personalized and informed responses based on th
         }
 
     except Exception as e:
-        print(f"Error in chat endpoint: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Error in chat endpoint: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
 async def handle_memory(chat_request: ChatRequest):
     """Handle memory extraction requests with direct GPT service call"""
-    print("[Backend] 🧠 Processing memory extraction request")
+    logger.info("[Backend] 🧠 Processing memory extraction request")
 
     # Build messages array
     if chat_request.messages:
@@ -284,7 +324,7 @@ async def handle_memory(chat_request: ChatRequest):
             system_prompt="You are a memory extraction assistant. Your job is to extract key facts from conversations and return ONLY a valid JSON array. Do not include any reasoning, explanations, or other text. Return only the JSON array starting with [ and ending with ].",
         )
 
-        print(f"[Backend] 🧠 Raw GPT response: {response_text[:200]}...")
+        logger.debug("[Backend] 🧠 Raw GPT response: %s...", response_text[:200])
 
         # Extract JSON array from response
         json_start = response_text.find("[")
@@ -292,7 +332,7 @@ async def handle_memory(chat_request: ChatRequest):
 
         if json_start != -1 and json_end != -1 and json_start < json_end:
             json_array = response_text[json_start : json_end + 1]
-            print(f"[Backend] 🧠 Extracted JSON: {json_array}")
+            logger.debug("[Backend] 🧠 Extracted JSON: %s", json_array)
 
             import json as json_lib
 
@@ -307,14 +347,14 @@ async def handle_memory(chat_request: ChatRequest):
                         "meta": {"extracted_memories": len(parsed)},
                     }
                 else:
-                    print(
-                        f"[Backend] 🧠 ❌ Parsed result is not an array: {type(parsed)}"
+                    logger.warning(
+                        "[Backend] 🧠 ❌ Parsed result is not an array: %s", type(parsed)
                     )
             except json_lib.JSONDecodeError as e:
-                print(f"[Backend] 🧠 ❌ JSON parsing error: {e}")
+                logger.warning("[Backend] 🧠 ❌ JSON parsing error: %s", e)
 
         # Fallback: return the raw response if JSON extraction fails
-        print("[Backend] 🧠 ❌ Failed to extract valid JSON, returning raw response")
+        logger.warning("[Backend] 🧠 ❌ Failed to extract valid JSON, returning raw response")
         return {
             "response": response_text,
             "status": "success",
@@ -322,10 +362,7 @@ async def handle_memory(chat_request: ChatRequest):
         }
 
     except Exception as e:
-        print(f"[Backend] 🧠 ❌ Memory extraction error: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("[Backend] 🧠 ❌ Memory extraction error: %s", e)
         raise HTTPException(
             status_code=500, detail=f"Memory extraction failed: {str(e)}"
         )
@@ -360,13 +397,13 @@ async def memory_proxy(request: Request):
                 forward_headers[key] = value
 
         # Forward the request to memory extraction service
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                target_url,
-                headers=forward_headers,
-                content=body,
-                timeout=config.MEMORY_EXTRACTION_TIMEOUT,
-            )
+        client = get_proxy_client()
+        response = await client.post(
+            target_url,
+            headers=forward_headers,
+            content=body,
+            timeout=config.MEMORY_EXTRACTION_TIMEOUT,
+        )
 
         logger.info(
             f"Memory extraction service responded with status: {response.status_code}"
@@ -411,20 +448,24 @@ async def memory_proxy(request: Request):
 async def stream_with_orchestrator(chat_request: ChatRequest, request: Request):
     """Enhanced streaming endpoint with orchestrator and sub-agent visibility"""
 
-    print(f"[Backend] 🚀 Received streaming request to /api/stream")
-    print(
-        f"[Backend] 📝 Message: {chat_request.message[:100]}{'...' if len(chat_request.message) > 100 else ''}"
-    )
-    print(
-        f"[Backend] 📚 Messages array length: {len(chat_request.messages) if chat_request.messages else 0}"
-    )
+    logger.info("[Backend] 🚀 Received streaming request to /api/stream")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[Backend] 📝 Message: %s%s",
+            chat_request.message[:100], "..." if len(chat_request.message) > 100 else "",
+        )
+        logger.debug(
+            "[Backend] 📚 Messages array length: %d",
+            len(chat_request.messages) if chat_request.messages else 0,
+        )
 
-    if chat_request.messages:
-        print(f"[Backend] 📋 Full messages received:")
-        for i, msg in enumerate(chat_request.messages):
-            print(
-                f"[Backend] {i + 1}. [{msg.role}] {msg.content[:150]}{'...' if len(msg.content) > 150 else ''}"
-            )
+        if chat_request.messages:
+            logger.debug("[Backend] 📋 Full messages received:")
+            for i, msg in enumerate(chat_request.messages):
+                logger.debug(
+                    "[Backend] %d. [%s] %s%s",
+                    i + 1, msg.role, msg.content[:150], "..." if len(msg.content) > 150 else "",
+                )
 
     gpt_service = await get_gpt_service()
     # Build messages array with conversation history
@@ -434,7 +475,7 @@ async def stream_with_orchestrator(chat_request: ChatRequest, request: Request):
     else:
         messages.append(ChatMessage(role="user", content=chat_request.message))
 
-    print(f"[Backend] 🔍 Looking for memory context in {len(messages)} messages...")
+    logger.debug("[Backend] 🔍 Looking for memory context in %d messages...", len(messages))
 
     # Extract memory context from system messages if present
     memory_context = ""
@@ -444,10 +485,10 @@ async def stream_with_orchestrator(chat_request: ChatRequest, request: Request):
             "## Relevant Context from Previous Conversations"
         ):
             memory_context = msg.content
-            print(
-                f"[Backend] 🧠 Found memory context! Length: {len(memory_context)} characters"
+            logger.debug(
+                "[Backend] 🧠 Found memory context! Length: %d characters", len(memory_context)
             )
-            print(f"[Backend] 📄 Memory context preview: {memory_context[:200]}...")
+            logger.debug("[Backend] 📄 Memory context preview: %s...", memory_context[:200])
         else:
             filtered_messages.append(msg)
 
@@ -455,11 +496,11 @@ async def stream_with_orchestrator(chat_request: ChatRequest, request: Request):
     messages = filtered_messages
 
     if memory_context:
-        print(
-            f"[Backend] ✅ Memory context extracted and will be integrated into system prompt"
+        logger.debug(
+            "[Backend] ✅ Memory context extracted and will be integrated into system prompt"
         )
     else:
-        print(f"[Backend] ❌ No memory context found in messages")
+        logger.debug("[Backend] ❌ No memory context found in messages")
 
     async def orchestrator_event_stream():
         orchestrator_task = None
@@ -481,15 +522,15 @@ async def stream_with_orchestrator(chat_request: ChatRequest, request: Request):
 
 Use this context to provide more personalized and informed responses based on the user's previous conversations and preferences."""
                 orchestrator.system_prompt = enhanced_prompt
-                print(f"[Backend] 🔧 Enhanced system prompt with memory context")
-                print(
-                    f"[Backend] 📄 Final system prompt length: {len(enhanced_prompt)} characters"
+                logger.debug("[Backend] 🔧 Enhanced system prompt with memory context")
+                logger.debug(
+                    "[Backend] 📄 Final system prompt length: %d characters", len(enhanced_prompt)
                 )
-                print(
-                    f"[Backend] 📋 Final system prompt preview: {enhanced_prompt[:300]}..."
+                logger.debug(
+                    "[Backend] 📋 Final system prompt preview: %s...", enhanced_prompt[:300]
                 )
             else:
-                print(f"[Backend] ⚠️ No memory context to integrate into system prompt")
+                logger.debug("[Backend] ⚠️ No memory context to integrate into system prompt")
 
             # Use asyncio.Queue to stream events in real-time
             event_queue = asyncio.Queue()
@@ -525,42 +566,31 @@ Use this context to provide more personalized and informed responses based on th
             # Start orchestrator in background
             orchestrator_task = asyncio.create_task(orchestrator.run(messages))
 
-            # Stream events as they come in
-            while True:
-                try:
-                    # Wait for either an event or orchestrator completion
-                    done, pending = await asyncio.wait(
-                        [asyncio.create_task(event_queue.get()), orchestrator_task],
-                        return_when=asyncio.FIRST_COMPLETED,
-                    )
-
-                    # Check if orchestrator is done
-                    if orchestrator_task in done:
-                        final_response = await orchestrator_task
-
-                        # Cancel pending event queue task
-                        for task in pending:
-                            task.cancel()
-
-                        # Drain remaining events from queue
+            # Stream events as they come in. One queue.get() task stays pending
+            # until it delivers, and everything already queued is sent in the
+            # same pass, so a burst of tokens costs one wake-up rather than a
+            # fresh get() task per token.
+            get_task = None
+            try:
+                while True:
+                    try:
+                        if get_task is None:
+                            get_task = asyncio.create_task(event_queue.get())
+
+                        # Wait for either an event or orchestrator completion
+                        done, _ = await asyncio.wait(
+                            [get_task, orchestrator_task],
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+
+                        events = []
+                        if get_task in done:
+                            events.append(get_task.result())
+                            get_task = None
                         while not event_queue.empty():
-                            try:
-                                event = event_queue.get_nowait()
-                                if await request.is_disconnected():
-                                    return
+                            events.append(event_queue.get_nowait())
 
-                                yield {
-                                    "data": json.dumps(event),
-                                    "event": event.get("type", "unknown"),
-                                }
-                            except asyncio.QueueEmpty:
-                                break
-                        break
-
-                    # Process events
-                    for task in done:
-                        if task != orchestrator_task:
-                            event = await task
+                        for event in events:
                             if await request.is_disconnected():
                                 logger.info("Client disconnected, stopping stream")
                                 orchestrator_task.cancel()
@@ -568,18 +598,21 @@ Use this context to provide more personalized and informed responses based on th
 
                             if isinstance(event, dict):
                                 yield {
-                                    "data": json.dumps(event),
+                                    "data": fast_json.dumps(event).decode(),
                                     "event": event.get("type", "unknown"),
                                 }
 
-                    # Cancel pending event queue tasks (not the orchestrator)
-                    for task in pending:
-                        if task != orchestrator_task:
-                            task.cancel()
+                        # Check if orchestrator is done (its queued events were sent above)
+                        if orchestrator_task in done:
+                            final_response = await orchestrator_task
+                            break
 
-                except asyncio.CancelledError:
-                    logger.info("Stream cancelled")
-                    break
+                    except asyncio.CancelledError:
+                        logger.info("Stream cancelled")
+                        break
+            finally:
+                if get_task is not None:
+                    get_task.cancel()
 
             # Send final response
             if final_response:
@@ -639,22 +672,21 @@ async def summarize_conversation(conversation_dict: List[dict]):
 
     gpt_service = await get_gpt_service()
     headers, model, url = gpt_service.get_chat_completion_params()
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{url}/v1/chat/completions",
-            json={
-                "messages": conversation_dict,
-                "temperature": 1.0,
-                "top_p": 1.0,
-                "max_tokens": 32767,
-                "stream": False,
-                "model": model,
-                "reasoning_effort": "medium",
-            },
-            headers=headers,
-            timeout=config.INFERENCE_TIMEOUT,
-        )
-    result = response.json()
+    client = gpt_service._get_http_client()
+    response = await client.post(
+        f"{url}/v1/chat/completions",
+        content=fast_json.dumps({
+            "messages": conversation_dict,
+            "temperature": 1.0,
+            "top_p": 1.0,
+            "max_tokens": 32767,
+            "stream": False,
+            "model": model,
+            "reasoning_effort": "medium",
+        }),
+        headers=headers,
+    )
+    result = fast_json.loads(response.content)
 
     # Validate response structure
     if "choices" not in result or not result["choices"]:
@@ -714,16 +746,16 @@ async def embeddings_health():
         target_url = f"{config.EMBEDDINGS_URL}/health"
         logger.info(f"Checking embeddings health at: {target_url}")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                target_url,
-                timeout=config.EMBEDDINGS_TIMEOUT,
-            )
+        client = get_proxy_client()
+        response = await client.get(
+            target_url,
+            timeout=config.EMBEDDINGS_TIMEOUT,
+        )
 
         logger.info(
             f"Embeddings health check responded with status: {response.status_code}"
         )
-        return response.json()
+        return fast_json.loads(response.content)
 
     except httpx.ConnectError as e:
         logger.error(
@@ -769,16 +801,16 @@ async def embeddings_embed(request: Request):
                 forward_headers[key] = value
 
         # Forward the request to embeddings service
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                target_url,
-                headers=forward_headers,
-                content=body,
-                timeout=config.EMBEDDINGS_TIMEOUT,
-            )
+        client = get_proxy_client()
+        response = await client.post(
+            target_url,
+            headers=forward_headers,
+            content=body,
+            timeout=config.EMBEDDINGS_TIMEOUT,
+        )
 
         logger.info(f"Embeddings service responded with status: {response.status_code}")
-        return response.json()
+        return fast_json.loads(response.content)
 
     except httpx.ConnectError as e:
         logger.error(
@@ -841,14 +873,14 @@ async def proxy_embeddings(request: Request, path: str):
                 forward_headers[key] = value
 
         # Forward the request
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=request.method,
-                url=target_url,
-                headers=forward_headers,
-                content=body,
-                timeout=config.EMBEDDINGS_TIMEOUT,
-            )
+        client = get_proxy_client()
+        response = await client.request(
+            method=request.method,
+            url=target_url,
+            headers=forward_headers,
+            content=body,
+            timeout=config.EMBEDDINGS_TIMEOUT,
+        )
 
         # Prepare response headers (exclude hop-by-hop headers)
         response_headers = {}
@@ -875,9 +907,16 @@ if __name__ == "__main__":
     import uvicorn
     import sys
 
+    # Prefer the libuv-based event loop when available
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
     try:
         logger.info(f"Starting server on {config.API_HOST}:{config.API_PORT}")
-        uvicorn.run(app, host=config.API_HOST, port=config.API_PORT, log_level="info")
+        uvicorn.run(app, host=config.API_HOST, port=config.API_PORT, log_level="info", loop=loop)
     except Exception as e:
         logger.error(f"Failed to start server: {str(e)}")
         sys.exit(1)
@@ -40,7 +40,7 @@ class NestedOrchestrator(Orchestrator):
         """Discover the full hierarchy of agents and their paths"""
         # Start with direct tools
         for tool_name, tool_info in self.gpt_service._tool_registry.items():
-            executor = tool_info.get('executor')
+            executor = tool_info.executor
             if executor and hasattr(executor, '__self__'):
                 agent_instance = executor.__self__
                 if hasattr(agent_instance, 'emit') and hasattr(agent_instance, 'on'):
@@ -57,7 +57,7 @@ class NestedOrchestrator(Orchestrator):
             return
             
         for tool_name, tool_info in parent_agent.gpt_service._tool_registry.items():
-            executor = tool_info.get('executor')
+            executor = tool_info.executor
             if executor and hasattr(executor, '__self__'):
                 agent_instance = executor.__self__
                 if hasattr(agent_instance, 'emit') and hasattr(agent_instance, 'on'):
@@ -71,7 +71,7 @@ class NestedOrchestrator(Orchestrator):
     def _setup_nested_event_forwarding(self):
         """Set up event forwarding with full path context"""
         for tool_name, tool_info in self.gpt_service._tool_registry.items():
-            executor = tool_info.get('executor')
+            executor = tool_info.executor
             if executor and hasattr(executor, '__self__'):
                 agent_instance = executor.__self__
                 if hasattr(agent_instance, 'emit') and hasattr(agent_instance, 'on'):
@@ -103,7 +103,7 @@ class NestedOrchestrator(Orchestrator):
     def _setup_recursive_forwarding_for_agent(self, agent_instance, parent_path: str):
         """Set up recursive event forwarding for a specific agent's sub-agents"""
         for tool_name, tool_info in agent_instance.gpt_service._tool_registry.items():
-            executor = tool_info.get('executor')
+            executor = tool_info.executor
             if executor and hasattr(executor, '__self__'):
                 sub_agent_instance = executor.__self__
                 if hasattr(sub_agent_instance, 'emit') and hasattr(sub_agent_instance, 'on'):
@@ -85,7 +85,7 @@ class Orchestrator(AgentTool):
         """Set up event forwarding for all registered sub-agents"""
 
         for tool_name, tool_info in self.gpt_service._tool_registry.items():
-            executor = tool_info.get('executor')
+            executor = tool_info.executor
             if executor and hasattr(executor, '__self__'):
                 agent_instance = executor.__self__
                 # Check if it's an EventEmitter (AgentTool)
@@ -127,7 +127,7 @@ class Orchestrator(AgentTool):
         """Clean up event listeners from all registered sub-agents"""
 
         for tool_name, tool_info in self.gpt_service._tool_registry.items():
-            executor = tool_info.get('executor')
+            executor = tool_info.executor
             if executor and hasattr(executor, '__self__'):
                 agent_instance = executor.__self__
                 # Check if it's an EventEmitter (AgentTool)
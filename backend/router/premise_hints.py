@@ -0,0 +1,100 @@
+"""
+Clarifications for questions built on a common false premise
+
+A user turn such as "Who is the president of Spain?" asks for an office the
+country does not have. premise_hint() recognizes a few of these and returns
+a note for the orchestrator so the model does not have to spend reasoning
+tokens discovering the mismatch.
+
+Only whole present-tense questions match ("who/what is the <title> of
+<country>?"), so historical questions ("who was the last king of France")
+and longer names that merely start with a country ("president of Japan
+Airlines") are left alone.
+"""
+
+import re
+from typing import Dict
+
+# Lower-case name as typed -> name used in the note
+_MONARCHIES: Dict[str, str] = {
+    "spain": "Spain",
+    "the uk": "The UK",
+    "the united kingdom": "The United Kingdom",
+    "britain": "Britain",
+    "great britain": "Great Britain",
+    "england": "England",
+    "japan": "Japan",
+    "canada": "Canada",
+    "australia": "Australia",
+    "the netherlands": "The Netherlands",
+    "sweden": "Sweden",
+    "norway": "Norway",
+    "denmark": "Denmark",
+    "belgium": "Belgium",
+}
+_REPUBLICS: Dict[str, str] = {
+    "france": "France",
+    "the us": "The US",
+    "the usa": "The USA",
+    "the united states": "The United States",
+    "america": "America",
+    "germany": "Germany",
+    "italy": "Italy",
+    "russia": "Russia",
+    "china": "China",
+    "india": "India",
+    "brazil": "Brazil",
+    "mexico": "Mexico",
+}
+_US = {name: _REPUBLICS[name] for name in ("the us", "the usa", "the united states", "america")}
+
+# (title pattern, countries, clarification)
+_PREMISE_HINTS = (
+    (
+        r"president",
+        _MONARCHIES,
+        "{0} has no president - the head of government is the Prime Minister and "
+        "the head of state is the monarch. Say so and name both.",
+    ),
+    (
+        r"(?:king|queen|monarch)",
+        _REPUBLICS,
+        "{0} has no monarch - it is a republic. Say so and name its president "
+        "(and head of government, if different).",
+    ),
+    (
+        r"prime\s+minister",
+        _US,
+        "{0} has no prime minister - the President is both head of state and head "
+        "of government. Say so and name the President.",
+    ),
+)
+
+
+def _question_re(title: str, countries: Dict[str, str]) -> "re.Pattern[str]":
+    """Match the whole message as "who/what is the <title> of <country>?" """
+    names = "|".join(
+        re.escape(name).replace(r"\ ", r"\s+")
+        for name in sorted(countries, key=len, reverse=True)
+    )
+    return re.compile(
+        rf"^\s*(?:who|what)(?:\s+is|['’]s)\s+(?:the\s+)?(?:current\s+)?{title}"
+        rf"\s+of\s+(?P<country>{names})\s*[?.!]*\s*$",
+        re.IGNORECASE,
+    )
+
+
+_PREMISE_RES = tuple(
+    (_question_re(title, countries), countries, hint)
+    for title, countries, hint in _PREMISE_HINTS
+)
+
+
+def premise_hint(text: str) -> str:
+    """Return a clarification note if text asks about a known false premise, else ''"""
+    for pattern, countries, hint in _PREMISE_RES:
+        match = pattern.match(text)
+        if match is not None:
+            country = " ".join(match.group("country").lower().split())
+            return f"Note on the user's question: {hint.format(countries[country])}"
+    return ""
@@ -1,8 +1,29 @@
 import asyncio
+import contextlib
 from typing import Dict, List, Callable, Union
 import json
+import logging
+import fast_json
 from constants import MAX_FAILED_COMPLETIONS
 
+logger = logging.getLogger(__name__)
+
+
+class _Status:
+    """Sentinel yielded by process_llm_response_with_tools to signal loop control"""
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+# Compared by identity - content chunks are plain dicts, anything else is one of these
+STOP = _Status("stop")
+CONTINUE = _Status("continue")
+EMPTY = _Status("empty")
 
 
 # ------------------------------------------------------------------------
@@ -88,7 +109,7 @@ async def execute_single_tool_call(tool_call: dict, execute_tool: Callable) -> T
 
     # Validate required fields
     if not tool_name or not tool_args_str:
-        print(f"   ❌ Missing tool_name or tool_args_str")
+        logger.warning("   ❌ Missing tool_name or tool_args_str")
         return ToolCallResponse(
             success=False,
             new_conversation_entries=[],
@@ -97,7 +118,7 @@ async def execute_single_tool_call(tool_call: dict, execute_tool: Callable) -> T
 
     try:
         # Parse tool arguments from JSON string
-        tool_args = json.loads(tool_args_str)
+        tool_args = fast_json.loads(tool_args_str)
 
         # Add assistant's tool call to conversation
         local_conversation.append({
@@ -109,7 +130,7 @@ async def execute_single_tool_call(tool_call: dict, execute_tool: Callable) -> T
         # Clean tool arguments using schema-based approach
         tool_args = clean_tool_arguments(tool_name, tool_args)
 
-        print(f"   🚀 Executing tool: {tool_name}")
+        logger.debug("   🚀 Executing tool: %s", tool_name)
 
         # Execute the tool
         result = await execute_tool(tool_name, tool_args)
@@ -127,7 +148,7 @@ async def execute_single_tool_call(tool_call: dict, execute_tool: Callable) -> T
             "content": "Based on the tool call answer my previous question.",
         })
 
-        print(f"   ✅ Tool call succeeded: {tool_name}")
+        logger.debug("   ✅ Tool call succeeded: %s", tool_name)
 
         return ToolCallResponse(
             success=True,
@@ -136,7 +157,7 @@ async def execute_single_tool_call(tool_call: dict, execute_tool: Callable) -> T
         )
 
     except json.JSONDecodeError as e:
-        print(f"   ❌ JSON parsing error: {str(e)}")
+        logger.warning("   ❌ JSON parsing error: %s", e)
         error_result = {"error": f"Invalid JSON arguments: {str(e)}"}
         local_conversation.append(
             format_tool_result_for_llm(
@@ -151,9 +172,8 @@ async def execute_single_tool_call(tool_call: dict, execute_tool: Callable) -> T
         )
 
     except Exception as e:
-        print(f"   ❌ Execution error in {tool_name}: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        # Logged through the handler configured in main.py, which writes off the event loop
+        logger.exception("   ❌ Execution error in %s: %s", tool_name, e)
         error_result = {"error": str(e)}
         local_conversation.append(
             format_tool_result_for_llm(
@@ -219,11 +239,36 @@ def count_total_tool_calls(conversation):
             total += len(msg["tool_calls"])
     return total
 
+async def stream_llm_response(llm_stream_once: Callable, conversation: List[dict]):
+    """
+    Relay one tool-free LLM response without the tool-calling state machine
+
+    Args:
+        llm_stream_once: Function that streams one LLM response
+        conversation: Current conversation messages
+
+    Yields:
+        dict: {"channel": "content" | "reasoning", "data": str}
+    """
+    async with contextlib.aclosing(llm_stream_once(conversation)) as stream:
+        async for delta in stream:
+            choices = delta.get("choices")
+            if not choices:
+                continue
+
+            delta_obj = choices[0].get("delta", {})
+            if delta_obj.get("content"):
+                yield {"channel": "content", "data": delta_obj["content"]}
+            elif delta_obj.get("reasoning_content"):
+                yield {"channel": "reasoning", "data": delta_obj["reasoning_content"]}
+
 async def process_llm_response_with_tools(
         execute_tool: Callable,
         llm_stream_once: Callable,
         conversation: List[dict],
         agent_name: str,
+        parallel: bool = True,
+        failed_completions: int = 0,
     ):
     """
     Process one LLM response and handle tool calls if needed
@@ -231,12 +276,14 @@ async def process_llm_response_with_tools(
     Args:
         llm_stream_once: Function that streams one LLM response
         conversation: Current conversation messages
+        parallel: Run the tool calls of one turn concurrently (results keep
+            the order the model emitted them in)
+        failed_completions: Empty completions already retried by the caller
 
     Yields:
-        tuple: (content_chunk, status, citations)
-        - content_chunk: str or None (content to stream to client)
-        - status: str ("continue", "stop", or None for continue streaming)
-        - citations: current list of citations
+        dict | _Status: either a content chunk to stream to the client
+        ({"channel": "content" | "reasoning", "data": str}) or one of the
+        STOP / CONTINUE / EMPTY sentinels
     """
     current_tool_calls = []
     saw_tool_call = False
@@ -246,189 +293,197 @@ async def process_llm_response_with_tools(
     accumulated_reasoning = ""
     accumulated_tool_calls = []
 
-    print(f"🔍 [agent: {agent_name}] === Starting process_llm_response_with_tools ===")
-    print(f"🔍 [agent: {agent_name}] Conversation history has {len(conversation)} messages")
+    logger.debug("🔍 [agent: %s] === Starting process_llm_response_with_tools ===", agent_name)
+    logger.debug("🔍 [agent: %s] Conversation history has %d messages", agent_name, len(conversation))
 
     # Stream one LLM response
     delta_count = 0
     content_deltas_count = 0  # Track actual content (not just reasoning markers)
     reasoning_deltas_count = 0  # Track reasoning_content deltas
     max_deltas_without_content = 500  # Safety limit for final synthesis (plenty of room for medium reasoning)
-    failed_tool_calls = 0
-    async for delta in llm_stream_once(conversation):
-        delta_count += 1
-
-        if "choices" not in delta or not delta["choices"]:
-            continue
-
-        choice = delta["choices"][0]
-        delta_obj = choice.get("delta", {})
-
-        # Accumulate tool calls
-        if "tool_calls" in delta_obj:
-            saw_tool_call = True
-
-            for tc_delta in delta_obj["tool_calls"]:
-                tc_index = tc_delta.get("index", 0)
-                # Ensure array is large enough
-                while len(current_tool_calls) <= tc_index:
-                    current_tool_calls.append({
-                        "id": "",
-                        "type": "function",
-                        "function": {"name": "", "arguments": ""}
-                    })
-
-                # Accumulate data
-                if "id" in tc_delta:
-                    current_tool_calls[tc_index]["id"] = tc_delta["id"]
-                if "type" in tc_delta:
-                    current_tool_calls[tc_index]["type"] = tc_delta["type"]
-                if "function" in tc_delta:
-                    func = tc_delta["function"]
-                    if "name" in func:
-                        current_tool_calls[tc_index]["function"]["name"] += func["name"]
-                    if "arguments" in func:
-                        current_tool_calls[tc_index]["function"]["arguments"] += func["arguments"]
+    failed_tool_calls = failed_completions
+    async with contextlib.aclosing(llm_stream_once(conversation)) as stream:
+        async for delta in stream:
+            delta_count += 1
+
+            if "choices" not in delta or not delta["choices"]:
+                continue
+
+            choice = delta["choices"][0]
+            delta_obj = choice.get("delta", {})
+
+            # Accumulate tool calls
+            if "tool_calls" in delta_obj:
+                saw_tool_call = True
+
+                for tc_delta in delta_obj["tool_calls"]:
+                    tc_index = tc_delta.get("index", 0)
+                    # Ensure array is large enough
+                    while len(current_tool_calls) <= tc_index:
+                        current_tool_calls.append({
+                            "id": "",
+                            "type": "function",
+                            "function": {"name": "", "arguments": ""}
+                        })
+
+                    # Accumulate data
+                    if "id" in tc_delta:
+                        current_tool_calls[tc_index]["id"] = tc_delta["id"]
+                    if "type" in tc_delta:
+                        current_tool_calls[tc_index]["type"] = tc_delta["type"]
+                    if "function" in tc_delta:
+                        func = tc_delta["function"]
+                        if "name" in func:
+                            current_tool_calls[tc_index]["function"]["name"] += func["name"]
+                        if "arguments" in func:
+                            current_tool_calls[tc_index]["function"]["arguments"] += func["arguments"]
                 
-                # Log tool call accumulation
-
-
-        # Stream content to client and print reasoning as it happens
-        # HARMONY FORMAT FIX: GPT-OSS streams to "reasoning_content" after tool calls
-        # We need to capture both "content" and "reasoning_content" channels
-        elif "content" in delta_obj and delta_obj["content"]:
-            content_deltas_count += 1
-            accumulated_content += delta_obj["content"]
-            # Yield with explicit channel identification for frontend as a tuple
-            yield ({
-                "channel": "content",
-                "data": delta_obj["content"]
-            }, None)
-        elif "reasoning_content" in delta_obj and delta_obj["reasoning_content"]:
-            reasoning_deltas_count += 1
-            accumulated_reasoning += delta_obj["reasoning_content"]
+                    # Log tool call accumulation
+
+
+            # Stream content to client and print reasoning as it happens
+            # HARMONY FORMAT FIX: GPT-OSS streams to "reasoning_content" after tool calls
+            # We need to capture both "content" and "reasoning_content" channels
+            elif "content" in delta_obj and delta_obj["content"]:
+                content_deltas_count += 1
+                accumulated_content += delta_obj["content"]
+                # Yield with explicit channel identification for frontend
+                yield {
+                    "channel": "content",
+                    "data": delta_obj["content"]
+                }
+            elif "reasoning_content" in delta_obj and delta_obj["reasoning_content"]:
+                reasoning_deltas_count += 1
+                accumulated_reasoning += delta_obj["reasoning_content"]
         
-            # Yield with explicit channel identification for frontend as a tuple
-            yield ({
-                "channel": "reasoning",
-                "data": delta_obj["reasoning_content"]
-            }, None)
-
-        # Safety: Force stop if final synthesis is stuck in reasoning loop
-        if "_final" in agent_name and delta_count > max_deltas_without_content and content_deltas_count == 0:
-            print(f"🔍 [agent: {agent_name}] ⚠️  SAFETY STOP: Too many deltas without content, forcing completion")
-            yield (None, "stop")
-            return
-
-        ## Check finish reason
-        finish_reason = choice.get("finish_reason")
-        if finish_reason:
-            total_tool_calls = count_total_tool_calls(conversation)
-            print(f"🔍 [agent: {agent_name}] 🎯 FINISH_REASON: '{finish_reason}' | current_turn: {len(current_tool_calls)} | total_so_far: {total_tool_calls}")
-
-            if finish_reason == "tool_calls" and current_tool_calls:
-                print(f"🔍 [agent: {agent_name}] ✅ EXECUTING {len(current_tool_calls)} TOOL(S)")
+                # Yield with explicit channel identification for frontend
+                yield {
+                    "channel": "reasoning",
+                    "data": delta_obj["reasoning_content"]
+                }
+
+            # Safety: Force stop if final synthesis is stuck in reasoning loop
+            if "_final" in agent_name and delta_count > max_deltas_without_content and content_deltas_count == 0:
+                logger.warning("🔍 [agent: %s] ⚠️  SAFETY STOP: Too many deltas without content, forcing completion", agent_name)
+                yield STOP
+                return
+
+            ## Check finish reason
+            finish_reason = choice.get("finish_reason")
+            if finish_reason:
+                total_tool_calls = count_total_tool_calls(conversation)
+                logger.debug(
+                    "🔍 [agent: %s] 🎯 FINISH_REASON: '%s' | current_turn: %d | total_so_far: %d",
+                    agent_name, finish_reason, len(current_tool_calls), total_tool_calls,
+                )
+
+                if finish_reason == "tool_calls" and current_tool_calls:
+                    logger.debug("🔍 [agent: %s] ✅ EXECUTING %d TOOL(S)", agent_name, len(current_tool_calls))
                
-                # Lo    g accumulated content and reasoning before tool execution
-                if accumulated_content:
-                    print(f"🔍 [agent: {agent_name}] 📄 ACCUMULATED CONTENT: '{accumulated_content}'")
-                if accumulated_reasoning:
-                    print(f"🔍 [agent: {agent_name}] 🧠 ACCUMULATED REASONING: '{accumulated_reasoning}'")
+                    # Log accumulated content and reasoning before tool execution
+                    if accumulated_content:
+                        logger.debug("🔍 [agent: %s] 📄 ACCUMULATED CONTENT: '%s'", agent_name, accumulated_content)
+                    if accumulated_reasoning:
+                        logger.debug("🔍 [agent: %s] 🧠 ACCUMULATED REASONING: '%s'", agent_name, accumulated_reasoning)
                 
-                # Log all tool calls being executed
-                for i, tool_call in enumerate(current_tool_calls):
-                    print(f"🔍 [agent: {agent_name}] 🛠️  TOOL CALL {i+1}: {tool_call}")
-                    accumulated_tool_calls.append(tool_call)
+                    # Log all tool calls being executed
+                    for i, tool_call in enumerate(current_tool_calls):
+                        logger.debug("🔍 [agent: %s] 🛠️  TOOL CALL %d: %s", agent_name, i + 1, tool_call)
+                        accumulated_tool_calls.append(tool_call)
                 
-                # Execute tool calls concurrently
-
-                # Create tasks for concurrent execution
-                tasks = []
-                for tool_call in current_tool_calls:
-                    tool_name = tool_call['function']['name']
-                    tool_args_str = tool_call['function']['arguments']
-
-                    # Parse and clean args for better logging
-                    try:
-                        tool_args_dict = json.loads(tool_args_str) if isinstance(tool_args_str, str) else tool_args_str
-                        cleaned_args = clean_tool_arguments(tool_name, tool_args_dict)
-                        print(f"🔍 [agent: {agent_name}]   → Tool: {tool_name}")
-                    except:
-                        print(f"🔍 [agent: {agent_name}]   → Tool: {tool_name}")
-
-                    task = execute_single_tool_call(tool_call, execute_tool)
-                    tasks.append(task)
-
-                # Execute all tool calls concurrently
-                results: List[Union[ToolCallResponse, BaseException]] = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Process all results
-                has_error = False
-                # handle tool call result and then continue
-                for i, result in enumerate(results):
-                    if isinstance(result, BaseException):
-                        print(f"🔍 [agent: {agent_name}] ❌ Tool error: {result}")
-                        has_error = True
-                        break
-                    elif isinstance(result, dict) and "success" in result:
-                        conversation.extend(result["new_conversation_entries"])
-
-                if has_error:
-                    yield (None, "stop")
-                    print("Returning at tool call error")
-
-                print(f"🔍 [agent: {agent_name}] 🔄 Returning 'continue' status to continue")               
-                yield (None, "continue") 
-
-            elif finish_reason == "stop":
+                    # Create one coroutine per tool call
+                    tasks = []
+                    for tool_call in current_tool_calls:
+                        # Arguments are parsed once, in execute_single_tool_call
+                        logger.debug("🔍 [agent: %s]   → Tool: %s", agent_name, tool_call['function']['name'])
+
+                        task = execute_single_tool_call(tool_call, execute_tool)
+                        tasks.append(task)
+
+                    # Execute all tool calls concurrently, or one after another if disabled
+                    results: List[Union[ToolCallResponse, BaseException]]
+                    if parallel and len(tasks) > 1:
+                        results = await asyncio.gather(*tasks, return_exceptions=True)
+                    else:
+                        results = []
+                        for task in tasks:
+                            try:
+                                results.append(await task)
+                            except Exception as e:
+                                results.append(e)
+
+                    # Append results in the order the model emitted the calls. A call
+                    # that raised gets an error result for its tool_call_id instead of
+                    # aborting the turn, so its siblings' results are still used.
+                    for tool_call, result in zip(current_tool_calls, results):
+                        if isinstance(result, (Exception, asyncio.CancelledError)):
+                            logger.warning("🔍 [agent: %s] ❌ Tool error: %s", agent_name, result)
+                            conversation.append({
+                                "role": "assistant",
+                                "content": "",
+                                "tool_calls": [tool_call]
+                            })
+                            conversation.append(format_tool_result_for_llm(
+                                tool_call["id"],
+                                {"error": f"Tool execution failed: {result}"}
+                            ))
+                        elif isinstance(result, BaseException):
+                            raise result
+                        elif isinstance(result, dict) and "success" in result:
+                            conversation.extend(result["new_conversation_entries"])
+
+                    logger.debug("🔍 [agent: %s] 🔄 Returning 'continue' status to continue", agent_name)               
+                    yield CONTINUE 
+
+                elif finish_reason == "stop":
                 
-                # Normal completion, we're done
-                print(f"Just finished, based on {choice} {delta}")
+                    # Normal completion, we're done
+                    logger.debug("Just finished, based on %s %s", choice, delta)
 
-                print(f"🔍 [agent: {agent_name}] ✅ NORMAL COMPLETION - finish_reason='stop'")
+                    logger.debug("🔍 [agent: %s] ✅ NORMAL COMPLETION - finish_reason='stop'", agent_name)
                 
-                # Log final accumulated content and reasoning
-                if not accumulated_content and not accumulated_tool_calls:
-                    if failed_tool_calls >= MAX_FAILED_COMPLETIONS or "_final" in agent_name:
-                        print(f"🔍 [agent: {agent_name}] 🛑 MAX FAILED COMPLETIONS REACHED: {MAX_FAILED_COMPLETIONS}")
-                        print(f"Reasoning: {accumulated_reasoning}")
-                        print(f"Content: {accumulated_content}")
-                        yield (None, "stop")
-                    else:
-                        developer_message = (
-                            "Oops! Looks like you sent your tool call to the reasoning channel, try again."
-                        )
-                        print(f"🔍 [agent: {agent_name}] 🛑 DEV MESSAGE: {developer_message}")
-                        print(f"Reasoning: {accumulated_reasoning}")
-                        print(f"Content: {accumulated_content}")
-                        conversation.append({"role": "system", "content": developer_message})
-                        failed_tool_calls += 1
-
-                        yield (None, "empty")
-                # Only log the first 10 characters (as per instruction "cars")
-                print(f"🔍 [agent: {agent_name}] 📄 FINAL CONTENT: '{accumulated_content[:10]}'")
+                    # Log final accumulated content and reasoning
+                    if not accumulated_content and not accumulated_tool_calls:
+                        if failed_tool_calls >= MAX_FAILED_COMPLETIONS or "_final" in agent_name:
+                            logger.warning("🔍 [agent: %s] 🛑 MAX FAILED COMPLETIONS REACHED: %d", agent_name, MAX_FAILED_COMPLETIONS)
+                            logger.debug("Reasoning: %s", accumulated_reasoning)
+                            logger.debug("Content: %s", accumulated_content)
+                            yield STOP
+                        else:
+                            developer_message = (
+                                "Oops! Looks like you sent your tool call to the reasoning channel, try again."
+                            )
+                            logger.info("🔍 [agent: %s] 🛑 DEV MESSAGE: %s", agent_name, developer_message)
+                            logger.debug("Reasoning: %s", accumulated_reasoning)
+                            logger.debug("Content: %s", accumulated_content)
+                            conversation.append({"role": "system", "content": developer_message})
+                            failed_tool_calls += 1
+
+                            yield EMPTY
+                    # Only log the first 10 characters (as per instruction "cars")
+                    logger.debug("🔍 [agent: %s] 📄 FINAL CONTENT: '%s'", agent_name, accumulated_content[:10])
    
-                print(f"🔍 [agent: {agent_name}] 🧠 FINAL REASONING: '{accumulated_reasoning}'")
+                    logger.debug("🔍 [agent: %s] 🧠 FINAL REASONING: '%s'", agent_name, accumulated_reasoning)
 
-                print(f"🔍 [agent: {agent_name}] 🛠️  TOTAL TOOL CALLS: {len(accumulated_tool_calls)}")
+                    logger.debug("🔍 [agent: %s] 🛠️  TOTAL TOOL CALLS: %d", agent_name, len(accumulated_tool_calls))
                 
-                print(f"🔍 [agent: {agent_name}] 🛑 RETURNING 'stop' status to exit")
-                yield (None, "stop")
+                    logger.debug("🔍 [agent: %s] 🛑 RETURNING 'stop' status to exit", agent_name)
+                    yield STOP
 
-            elif finish_reason == "length":
-                # Token limit reached - treat as stop
-                print(f"🔍 [agent: {agent_name}] ⚠️  Token limit reached, stopping")
-                yield (None, "stop")
+                elif finish_reason == "length":
+                    # Token limit reached - treat as stop
+                    logger.warning("🔍 [agent: %s] ⚠️  Token limit reached, stopping", agent_name)
+                    yield STOP
 
 
 
     # This shouldn't happen, but just in case
-    print(f"🔍 [agent: {agent_name}] ⚠️  Stream ended without finish_reason (no tool calls were made)")
+    logger.warning("🔍 [agent: %s] ⚠️  Stream ended without finish_reason (no tool calls were made)", agent_name)
     
     # Log any accumulated content even if stream ended unexpectedly
     if accumulated_content:
-        print(f"🔍 [agent: {agent_name}] 📄 UNEXPECTED END - CONTENT: '{accumulated_content}'")
+        logger.debug("🔍 [agent: %s] 📄 UNEXPECTED END - CONTENT: '%s'", agent_name, accumulated_content)
     if accumulated_reasoning:
-        print(f"🔍 [agent: {agent_name}] 🧠 UNEXPECTED END - REASONING: '{accumulated_reasoning}'")
+        logger.debug("🔍 [agent: %s] 🧠 UNEXPECTED END - REASONING: '%s'", agent_name, accumulated_reasoning)
     
-    yield (None, "stop")
\ No newline at end of file
+    yield STOP
\ No newline at end of file
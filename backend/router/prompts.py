@@ -3,6 +3,7 @@ Centralized system prompts (optimized for speed)
 Shorter, equivalent instructions for all agents.
 """
 
+import functools
 from datetime import datetime
 
 reasoning_instructions = {
@@ -129,7 +130,12 @@ PROMPTS = {
     "main_orchestrator": get_main_orchestrator_prompt,
 }
 
+@functools.lru_cache(maxsize=32)
+def _render_prompt(agent_name: str, day: str) -> str:
+    # day only keys the cache - prompts that embed the date are rebuilt when it changes
+    return PROMPTS[agent_name]()
+
 def get_prompt(agent_name: str) -> str:
     if agent_name not in PROMPTS:
         raise KeyError(f"Unknown agent '{agent_name}'. Available: {list(PROMPTS.keys())}")
-    return PROMPTS[agent_name]()
+    return _render_prompt(agent_name, datetime.now().strftime("%Y-%m-%d"))
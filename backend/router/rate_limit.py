@@ -0,0 +1,57 @@
+"""
+Request rate limiting for outbound calls (inference server, MCP gateways)
+
+Token buckets smooth request arrival so bursts of tool rounds or parallel
+tool calls stay under a provider's requests-per-second limit. Callers over
+the limit wait for capacity instead of failing. Buckets are per process.
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket refilled continuously at `rate` tokens per second
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        # Waiters are served in arrival order
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until `tokens` are available and take them"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+_buckets: Dict[str, Tuple[float, float, AsyncTokenBucket]] = {}
+
+
+def get_bucket(key: str, rate: float, burst: float = 0) -> Optional[AsyncTokenBucket]:
+    """
+    Shared bucket for `key` (e.g. an endpoint URL), or None when rate <= 0
+
+    All callers using the same key share one bucket, so the limit holds
+    across service instances.
+    """
+    if rate <= 0:
+        return None
+
+    entry = _buckets.get(key)
+    if entry is None or entry[0] != rate or entry[1] != burst:
+        entry = (rate, burst, AsyncTokenBucket(rate, burst or None))
+        _buckets[key] = entry
+    return entry[2]
@@ -5,9 +5,11 @@ Uses OpenAI's API to rate the reasonableness of AI responses (0-1 scale)
 based on how well they match the user's prompt and context.
 """
 
+import logging
 import os
 import httpx
 import json
+import fast_json
 from typing import Dict, Any, Optional
 import config
 from pathlib import Path
@@ -31,6 +33,8 @@ except ImportError:
 except Exception as e:
     print(f"Error loading .env file: {e}")
 
+logger = logging.getLogger(__name__)
+
 
 class ReasonablenessService:
     """Service for rating the reasonableness of AI responses."""
@@ -71,7 +75,7 @@ class ReasonablenessService:
                         "Authorization": f"Bearer {self.api_key}",
                         "Content-Type": "application/json"
                     },
-                    json={
+                    content=fast_json.dumps({
                         "messages": [
                             {
                                 "role": "system",
@@ -85,12 +89,11 @@ class ReasonablenessService:
                         "model": "gpt-4o-mini",
                         "tools": [self._get_rating_tool_definition()],
                         "tool_choice": "auto",
-                    }
-                    ,
+                    }),
                     timeout=300.0
                 )
                 if response.status_code != 200:
-                    print(f"Rating API error: {response.status_code} {response.text}")
+                    logger.error("Rating API error: %s %s", response.status_code, response.text)
                     return {
                 
                         "rating": 0.5,
@@ -99,7 +102,7 @@ class ReasonablenessService:
                         "issues": [f"API request failed: {response.status_code} {response.text}"]
                     }
                 
-                result = response.json()
+                result = fast_json.loads(response.content)
                 # Extract the tool call response
                 tool_calls = result["choices"][0]["message"].get("tool_calls", [])
                 if not tool_calls:
@@ -118,7 +121,7 @@ class ReasonablenessService:
                 return self._validate_rating_response(arguments)
 
         except httpx.TimeoutException as e:
-            print(f"Rating service timeout: {str(e)}")
+            logger.error("Rating service timeout: %s", e)
             return {
                 "rating": 0.5,
                 "reasoning": f"Rating service timeout: {str(e)}",
@@ -126,7 +129,7 @@ class ReasonablenessService:
                 "issues": ["Service timeout"]
             }
         except httpx.HTTPStatusError as e:
-            print(f"Rating service HTTP status error: {str(e)}")
+            logger.error("Rating service HTTP status error: %s", e)
             return {
                 "rating": 0.5,
                 "reasoning": f"Rating service HTTP status error: {str(e)}",
@@ -134,7 +137,7 @@ class ReasonablenessService:
                 "issues": ["Service HTTP status error"]
             }
         except httpx.RequestError as e:
-            print(f"Rating service request error: {str(e)}")
+            logger.error("Rating service request error: %s", e)
             return {
                 "rating": 0.5,
                 "reasoning": f"Rating service request error: {str(e)}",
@@ -142,7 +145,7 @@ class ReasonablenessService:
                 "issues": [f"Rating service request error: {str(e)}"]
             }
         except Exception as e:
-            print(f"Rating service error: {str(e)}")
+            logger.error("Rating service error: %s", e)
             return {
                 "rating": 0.5,
                 "reasoning": f"Rating service error: {str(e)}",
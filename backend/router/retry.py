@@ -0,0 +1,76 @@
+"""
+Retries for transient failures of outbound HTTP calls
+
+Only failures that happen before any response data is consumed are retried
+(connection errors, dropped connections, 502/503/504 from a proxy or an
+overloaded server), so a retry never duplicates output already streamed to
+the client.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, TypeVar
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Gateway / overload responses worth another attempt
+RETRYABLE_STATUS = frozenset({502, 503, 504})
+
+RETRYABLE_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Whether exc is a failure that is likely to succeed on retry"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS
+    return isinstance(exc, RETRYABLE_ERRORS)
+
+
+async def with_retry(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    retries: int = 3,
+    base_delay: float = 0.25,
+    max_delay: float = 8.0,
+    label: str = "request",
+) -> T:
+    """
+    Await fn(), retrying transient failures with exponential backoff
+
+    Args:
+        fn: Zero-argument coroutine function making one attempt
+        retries: Retries after the first attempt (0 = no retries)
+        base_delay: Delay before the first retry, doubled on each further retry
+        max_delay: Upper bound for a single delay
+        label: Name of the call for log messages
+
+    Returns:
+        The result of the first successful attempt
+    """
+    attempt = 0
+    while True:
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt >= retries or not is_transient(e):
+                raise
+            attempt += 1
+            # Full delay is jittered down to half so concurrent callers don't retry in lockstep
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+            delay *= 0.5 + random.random() / 2
+            logger.warning(
+                "%s failed (%s), retry %d/%d in %.2fs",
+                label, e.__class__.__name__, attempt, retries, delay,
+            )
+            await asyncio.sleep(delay)
@@ -0,0 +1,75 @@
+"""
+Near-duplicate lookup for cached tool results
+
+Sits in front of the exact-match tool result cache: a call whose free-text
+query is only phrased differently from an earlier one ("top 5 movies" vs
+"top five movies") is mapped to the cache key of that earlier call. All
+other arguments must match exactly. Embeddings are expected to be
+normalized, so cosine similarity is a dot product.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+import json
+
+
+# Argument holding the free-text query that is compared semantically
+QUERY_FIELD = "query"
+
+
+class SemanticToolCache:
+    """
+    Maps query embeddings to exact-match tool cache keys
+    """
+
+    def __init__(self, encode: Callable[[str], Any], threshold: float = 0.92, max_entries: int = 256):
+        self._encode = encode
+        self.threshold = threshold
+        self.max_entries = max_entries
+        # cache key -> (group, embedding), oldest first
+        self._entries: "OrderedDict[str, Tuple[Tuple[str, str], Any]]" = OrderedDict()
+        self.hits = 0
+
+    @staticmethod
+    def split_arguments(tool_name: str, arguments: dict) -> Optional[Tuple[Tuple[str, str], str]]:
+        """
+        Split a call into its group (tool plus the other arguments) and query text
+
+        Returns None for calls without a string query, which are not eligible.
+        """
+        query = arguments.get(QUERY_FIELD)
+        if not isinstance(query, str) or not query.strip():
+            return None
+
+        rest = {key: value for key, value in arguments.items() if key != QUERY_FIELD}
+        return (tool_name, json.dumps(rest, sort_keys=True, separators=(",", ":"))), query
+
+    def embed(self, query: str):
+        """Embed a query (CPU bound - run it off the event loop)"""
+        return self._encode(query)
+
+    def lookup(self, group: Tuple[str, str], embedding) -> Optional[str]:
+        """Return the cache key of the most similar earlier call in group, if close enough"""
+        best_key = None
+        best_score = self.threshold
+        for cache_key, (entry_group, entry_embedding) in self._entries.items():
+            if entry_group != group:
+                continue
+            score = float(entry_embedding @ embedding)
+            if score >= best_score:
+                best_key, best_score = cache_key, score
+
+        if best_key is not None:
+            self.hits += 1
+        return best_key
+
+    def add(self, group: Tuple[str, str], embedding, cache_key: str):
+        """Remember the embedding of a call whose result was cached under cache_key"""
+        self._entries[cache_key] = (group, embedding)
+        self._entries.move_to_end(cache_key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries"""
+        self._entries.clear()
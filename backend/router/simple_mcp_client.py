@@ -15,9 +15,13 @@ ARCHITECTURE:
 """
 
 import asyncio
+import itertools
 import json
 import httpx
-from typing import Dict, List, Any, Optional
+import fast_json
+from rate_limit import get_bucket
+from retry import with_retry
+from typing import Awaitable, Callable, Dict, List, Any, Optional, Set, Tuple
 
 
 class SimpleMCPClient:
@@ -28,17 +32,39 @@ class SimpleMCPClient:
     a clean async interface for tool operations.
     """
     
-    def __init__(self, gateway_urls: list[str]):
+    def __init__(
+        self,
+        gateway_urls: list[str],
+        rate_limit: float = 0,
+        rate_burst: float = 0,
+        retries: int = 0,
+        retry_base_delay: float = 0.25,
+    ):
         """
         Initialize MCP client
         
         Args:
             gateway_urls: List of MCP gateway URLs (e.g., ["http://gateway1:9011/mcp", "http://gateway2:9011/mcp"])
+            rate_limit: Max tool calls per second to each gateway (0 = unlimited)
+            rate_burst: Calls allowed in a burst above the rate (0 = one second's worth)
+            retries: Retries of a tool call after connection errors or 502/503/504
+            retry_base_delay: Delay before the first retry (doubled on each further retry)
         """
         self.gateway_urls = gateway_urls
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.retries = retries
+        self.retry_base_delay = retry_base_delay
         self.sessions: Dict[str, str] = {}  # gateway_url -> session_id
         self.client: Optional[httpx.AsyncClient] = None
         self._tool_cache: Dict[str, dict] = {}  # tool_name -> {tool_info, gateway_url}
+        # Called when a gateway sends notifications/tools/list_changed
+        self.on_tools_list_changed: Optional[Callable[[], Awaitable[None]]] = None
+        self._notification_tasks: Set[asyncio.Task] = set()
+        # JSON-RPC ids for tool calls, unique so concurrent calls can share a session
+        self._request_ids = itertools.count(3)
+        # Serializes lazy connects, so concurrent first calls share one handshake
+        self._connect_lock = asyncio.Lock()
     
     # ------------------------------------------------------------------------
     # Connection Management
@@ -62,36 +88,55 @@ class SimpleMCPClient:
         Returns:
             True if at least one connection successful, False otherwise
         """
-        try:
-            success_count = 0
-            
-            for gateway_url in self.gateway_urls:
-                try:
-                    # Initialize session for this gateway
-                    session_id = await self._initialize_session(gateway_url)
-                    if not session_id:
-                        continue
-                    
-                    # Complete handshake
-                    await self._send_initialized(gateway_url, session_id)
-                    
-                    # Cache available tools from this gateway
-                    await self._cache_tools(gateway_url, session_id)
-                    
-                    # Store session
-                    self.sessions[gateway_url] = session_id
-                    success_count += 1
-                    
-                except Exception as e:
-                    continue
-            
-            if success_count > 0:
-                return True
-            else:
-                return False
-            
-        except Exception as e:
-            return False
+        # Gateways are independent, so their handshakes run concurrently
+        results = await asyncio.gather(
+            *(self._connect_gateway(gateway_url) for gateway_url in self.gateway_urls),
+            return_exceptions=True,
+        )
+
+        # Apply results in gateway order so tool routing doesn't depend on timing
+        success_count = 0
+        for gateway_url, result in zip(self.gateway_urls, results):
+            if isinstance(result, BaseException) or result is None:
+                continue
+
+            session_id, tools = result
+            for tool in tools:
+                # Store tool with its gateway URL for routing
+                self._tool_cache[tool["name"]] = {
+                    "tool_info": tool,
+                    "gateway_url": gateway_url
+                }
+            self.sessions[gateway_url] = session_id
+            success_count += 1
+
+        return success_count > 0
+
+    async def _ensure_connected(self) -> None:
+        """Connect to all gateways if no tools are cached yet"""
+        if self._tool_cache:
+            return
+        async with self._connect_lock:
+            if not self._tool_cache:
+                await self.connect()
+
+    async def _connect_gateway(self, gateway_url: str) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Run the handshake with one gateway and fetch its tools
+
+        Returns:
+            (session_id, tools), or None if the gateway did not open a session
+        """
+        # Initialize session for this gateway
+        session_id = await self._initialize_session(gateway_url)
+        if not session_id:
+            return None
+
+        # Complete handshake - the server must see it before any other request
+        await self._send_initialized(gateway_url, session_id)
+
+        # Fetch available tools from this gateway
+        return session_id, await self._fetch_tools(gateway_url, session_id)
     
     async def disconnect(self):
         """Disconnect from all MCP gateways"""
@@ -146,8 +191,8 @@ class SimpleMCPClient:
             raise Exception(f"Initialized notification failed: {response.status_code}")
         
         
-    async def _cache_tools(self, gateway_url: str, session_id: str) -> None:
-        """Cache available tools from gateway"""
+    async def _fetch_tools(self, gateway_url: str, session_id: str) -> List[Dict[str, Any]]:
+        """Fetch available tools from gateway"""
         tools_request = {
             "jsonrpc": "2.0",
             "id": 2,
@@ -159,12 +204,8 @@ class SimpleMCPClient:
         result = self._parse_response(response)
         
         if "result" in result and "tools" in result["result"]:
-            for tool in result["result"]["tools"]:
-                # Store tool with its gateway URL for routing
-                self._tool_cache[tool["name"]] = {
-                    "tool_info": tool,
-                    "gateway_url": gateway_url
-                }
+            return result["result"]["tools"]
+        return []
         
     async def _send_request(self, gateway_url: str, request: dict, session_id: Optional[str] = None) -> httpx.Response:
         """
@@ -193,11 +234,15 @@ class SimpleMCPClient:
         response = await self.client.post(
             gateway_url,
             headers=headers,
-            json=request
+            content=fast_json.dumps(request)
         )
         
         if response.status_code not in [200, 202]:
-            raise Exception(f"MCP request failed: {response.status_code} - {response.text}")
+            raise httpx.HTTPStatusError(
+                f"MCP request failed: {response.status_code} - {response.text}",
+                request=response.request,
+                response=response,
+            )
         
         return response
     
@@ -211,24 +256,37 @@ class SimpleMCPClient:
         Returns:
             Parsed JSON object
         """
-        response_text = response.text
-        
-        # Handle SSE format (data: {...})
-        if "data: " in response_text:
-            lines = response_text.split('\n')
-            for line in lines:
-                if line.startswith('data: '):
-                    json_str = line[6:]  # Remove 'data: ' prefix
+        body = response.content
+        
+        # Handle SSE format (data: {...}) - parsed as bytes, without decoding to str first
+        if b"data: " in body:
+            for line in body.splitlines():
+                if line.startswith(b'data: '):
                     try:
-                        return json.loads(json_str)
-                    except json.JSONDecodeError:
+                        message = fast_json.loads(line[6:])  # Remove 'data: ' prefix
+                    except fast_json.JSONDecodeError:
+                        continue
+                    # Server notifications can be interleaved with the response
+                    if message.get("method") == "notifications/tools/list_changed":
+                        self._handle_tools_list_changed()
                         continue
+                    return message
             raise Exception("No valid JSON found in SSE response")
         
         # Handle regular JSON format
         else:
-            return response.json()
+            return fast_json.loads(body)
     
+    def _handle_tools_list_changed(self) -> None:
+        """Drop cached tools and notify the owner that a gateway's tool list changed"""
+        self._tool_cache.clear()
+        if self.on_tools_list_changed is None:
+            return
+
+        task = asyncio.get_running_loop().create_task(self.on_tools_list_changed())
+        self._notification_tasks.add(task)
+        task.add_done_callback(self._notification_tasks.discard)
+
     # ------------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------------
@@ -240,9 +298,7 @@ class SimpleMCPClient:
         Returns:
             List of tool definitions
         """
-        if not self._tool_cache:
-            # If no tools cached, try to connect to all gateways
-            await self.connect()
+        await self._ensure_connected()
         
         # Return just the tool info, hiding the gateway URL from users
         return [tool_data["tool_info"] for tool_data in self._tool_cache.values()]
@@ -257,9 +313,7 @@ class SimpleMCPClient:
         Returns:
             Tool definition or None if not found
         """
-        if not self._tool_cache:
-            # If no tools cached, try to connect to all gateways
-            await self.connect()
+        await self._ensure_connected()
         
         tool_data = self._tool_cache.get(tool_name)
         return tool_data["tool_info"] if tool_data else None
@@ -275,9 +329,7 @@ class SimpleMCPClient:
         Returns:
             Tool execution result
         """
-        if not self._tool_cache:
-            # If no tools cached, try to connect to all gateways
-            await self.connect()
+        await self._ensure_connected()
         
         if tool_name not in self._tool_cache:
             return {"error": f"Tool '{tool_name}' not found"}
@@ -292,7 +344,7 @@ class SimpleMCPClient:
         
         call_request = {
             "jsonrpc": "2.0",
-            "id": 3,
+            "id": next(self._request_ids),
             "method": "tools/call",
             "params": {
                 "name": tool_name,
@@ -300,8 +352,20 @@ class SimpleMCPClient:
             }
         }
         
+        async def send():
+            # Tool calls hit rate-limited upstream APIs (e.g. Brave search)
+            bucket = get_bucket(f"mcp:{gateway_url}", self.rate_limit, self.rate_burst)
+            if bucket is not None:
+                await bucket.acquire()
+            return await self._send_request(gateway_url, call_request, session_id)
+
         try:
-            response = await self._send_request(gateway_url, call_request, session_id)
+            response = await with_retry(
+                send,
+                retries=self.retries,
+                base_delay=self.retry_base_delay,
+                label=f"MCP tool {tool_name}",
+            )
             result = self._parse_response(response)
             
             # Extract and format the result
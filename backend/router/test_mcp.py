@@ -24,7 +24,7 @@ async def test_mcp_initialization():
             
             # Test each tool
             for tool_name, tool_info in gpt_service._tool_registry.items():
-                print(f"  - {tool_name}: {tool_info.get('description', 'No description')}")
+                print(f"  - {tool_name}: {tool_info.description or 'No description'}")
         else:
             print("⚠️  No tools registered")
             print("This could mean:")
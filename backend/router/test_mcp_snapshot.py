@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for the MCP tools snapshot: cold start, background refresh, and agents
+picking up refreshed tools. The MCP gateways are replaced by a fake client.
+"""
+import asyncio
+import os
+import tempfile
+import time
+import types
+
+import config
+import fast_json
+import gpt_service
+from agent_tool import AgentTool
+from events import EventEmitter
+
+
+GATEWAYS = ["http://gateway-a/mcp", "http://gateway-b/mcp"]
+SNAPSHOT_TOOLS = [
+    {"name": "web_search", "description": "old search", "inputSchema": {}},
+    {"name": "fetch", "description": "old fetch", "inputSchema": {}},
+]
+LIVE_TOOLS = [
+    {"name": "web_search", "description": "new search", "inputSchema": {}},
+    {"name": "fetch_v2", "description": "new fetch", "inputSchema": {}},
+]
+
+
+class FakeMCPClient:
+    """Stands in for SimpleMCPClient; list_tools answers after a short delay"""
+
+    tools = LIVE_TOOLS
+    list_calls = 0
+
+    def __init__(self, gateway_urls, **kwargs):
+        self.gateway_urls = gateway_urls
+        self.on_tools_list_changed = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def list_tools(self):
+        FakeMCPClient.list_calls += 1
+        await asyncio.sleep(0.01)
+        return self.tools
+
+
+def make_config(snapshot_path, gateway_urls=GATEWAYS):
+    settings = {name: getattr(config, name) for name in dir(config) if name.isupper()}
+    settings.update(
+        MCP_URLS=list(gateway_urls),
+        MCP_TOOLS_SNAPSHOT=snapshot_path,
+        MCP_TOOLS_SNAPSHOT_MAX_AGE=3600,
+        MCP_TOOLS_TTL=300,
+        SEMANTIC_TOOL_CACHE=False,
+    )
+    return types.SimpleNamespace(**settings)
+
+
+def write_snapshot(path, gateway_urls=GATEWAYS, saved_at=None):
+    snapshot = {
+        "gateway_urls": list(gateway_urls),
+        "saved_at": time.time() if saved_at is None else saved_at,
+        "tools": SNAPSHOT_TOOLS,
+    }
+    with open(path, "wb") as f:
+        f.write(fast_json.dumps(snapshot))
+
+
+def mcp_tools(service):
+    return sorted(name for name, entry in service._tool_registry.items() if entry.type == "mcp")
+
+
+def run_with_fake_client(test):
+    """Run an async test with the fake MCP client and a temporary snapshot path"""
+    real_client = gpt_service.SimpleMCPClient
+    gpt_service.SimpleMCPClient = FakeMCPClient
+    FakeMCPClient.list_calls = 0
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            asyncio.run(test(os.path.join(tmp, "mcp_tools.json")))
+    finally:
+        gpt_service.SimpleMCPClient = real_client
+
+
+def test_snapshot_load_and_refresh():
+    async def test(path):
+        write_snapshot(path)
+        service = gpt_service.GptService(make_config(path), EventEmitter())
+
+        await service._register_mcp_tools(use_snapshot=True)
+        # Registered from the snapshot, before the gateways answered
+        assert mcp_tools(service) == ["fetch", "web_search"]
+        assert service._primary_fetch_tool == "fetch"
+
+        await service._mcp_refresh_task
+        assert mcp_tools(service) == ["fetch_v2", "web_search"]
+        assert service._tool_registry["web_search"].description == "new search"
+        assert service._primary_fetch_tool == "fetch_v2"
+        # The refreshed list is written back for the next cold start
+        with open(path, "rb") as f:
+            assert fast_json.loads(f.read())["tools"] == LIVE_TOOLS
+
+    run_with_fake_client(test)
+
+
+def test_snapshot_ignored_for_other_gateways():
+    async def test(path):
+        write_snapshot(path, gateway_urls=["http://gateway-a/mcp"])
+        service = gpt_service.GptService(make_config(path), EventEmitter())
+
+        await service._register_mcp_tools(use_snapshot=True)
+        # The snapshot belongs to another gateway set - listed live instead
+        assert service._mcp_refresh_task is None
+        assert FakeMCPClient.list_calls == 1
+        assert mcp_tools(service) == ["fetch_v2", "web_search"]
+
+    run_with_fake_client(test)
+
+
+def test_stale_snapshot_ignored():
+    async def test(path):
+        write_snapshot(path, saved_at=time.time() - 7200)
+        service = gpt_service.GptService(make_config(path), EventEmitter())
+
+        await service._register_mcp_tools(use_snapshot=True)
+        assert service._mcp_refresh_task is None
+        assert mcp_tools(service) == ["fetch_v2", "web_search"]
+
+    run_with_fake_client(test)
+
+
+def test_agents_pick_up_refreshed_tools():
+    async def test(path):
+        write_snapshot(path)
+        service_config = make_config(path)
+        service = gpt_service.GptService(service_config, EventEmitter())
+        await service._register_mcp_tools(use_snapshot=True)
+
+        search_agent = AgentTool(service_config, "search_agent", "d", "p", ["web_search", "fetch", "fetch_v2"])
+        all_tools_agent = AgentTool(service_config, "all_tools_agent", "d", "p", [])
+        await search_agent.initialize(service, service_config)
+        await all_tools_agent.initialize(service, service_config)
+        assert mcp_tools(search_agent.gpt_service) == ["fetch", "web_search"]
+
+        await service._mcp_refresh_task
+        search_agent._sync_mcp_tools()
+        all_tools_agent._sync_mcp_tools()
+        for agent in (search_agent, all_tools_agent):
+            assert mcp_tools(agent.gpt_service) == ["fetch_v2", "web_search"]
+            assert agent.gpt_service._tool_registry["web_search"].description == "new search"
+
+    run_with_fake_client(test)
+
+
+if __name__ == "__main__":
+    test_snapshot_load_and_refresh()
+    test_snapshot_ignored_for_other_gateways()
+    test_stale_snapshot_ignored()
+    test_agents_pick_up_refreshed_tools()
+    print("✅ MCP snapshot tests passed")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tests for the false-premise hints added to orchestrator questions
+"""
+from premise_hints import premise_hint
+
+
+MATCHES = [
+    ("Who is the president of Spain?", "Spain has no president"),
+    ("who's the president of the UK", "The UK has no president"),
+    ("What is the current president of  Japan ?", "Japan has no president"),
+    ("Who is the king of France?", "France has no monarch"),
+    ("Who is the queen of the United States", "The United States has no monarch"),
+    ("who is the prime minister of the USA?", "The USA has no prime minister"),
+]
+
+NON_MATCHES = [
+    "Who was the last king of France?",
+    "Who is the president of Japan Airlines?",
+    "Who is the president of Canada Goose?",
+    "Who is the president of the UK Supreme Court?",
+    "Who is the prime minister of Spain?",
+    "Who is the president of France?",
+    "Tell me about the king of Spain",
+    "Write an essay about why Spain has no president of Spain",
+    "",
+]
+
+
+def test_premise_hint_matches():
+    for question, expected in MATCHES:
+        hint = premise_hint(question)
+        assert expected in hint, f"{question!r} -> {hint!r}"
+
+
+def test_premise_hint_non_matches():
+    for question in NON_MATCHES:
+        assert premise_hint(question) == "", f"{question!r} should not match"
+
+
+if __name__ == "__main__":
+    test_premise_hint_matches()
+    test_premise_hint_non_matches()
+    print("✅ premise hint tests passed")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming completion request body sent to the inference server
+"""
+import asyncio
+import json
+
+import httpx
+
+import config
+from events import EventEmitter
+from gpt_service import GptService
+
+
+TOOLS = [{
+    "type": "function",
+    "function": {"name": "brave_web_search", "description": "Search", "parameters": {"type": "object"}},
+}]
+
+
+async def capture_bodies(reasoning_effort, include_tools):
+    """Run one _llm_stream call against a mock server and return the request bodies"""
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, content=b"data: [DONE]\n\n", headers={"Content-Type": "text/event-stream"})
+
+    service = GptService(config, EventEmitter())
+    service._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        async for _ in service._llm_stream(
+            [{"role": "user", "content": "hi"}],
+            tools_for_llm=TOOLS,
+            include_tools=include_tools,
+            reasoning_effort=reasoning_effort,
+        ):
+            pass
+    finally:
+        await service._http.aclose()
+    return bodies
+
+
+def test_tool_rounds_send_callers_reasoning_effort():
+    bodies = asyncio.run(capture_bodies("high", include_tools=True))
+    assert len(bodies) == 1
+    assert bodies[0]["reasoning_effort"] == "high"
+    assert bodies[0]["tool_choice"] == "auto"
+    assert bodies[0]["messages"] == [{"role": "user", "content": "hi"}]
+    assert bodies[0]["tools"] == TOOLS
+
+
+def test_final_synthesis_runs_at_low():
+    bodies = asyncio.run(capture_bodies("high", include_tools=False))
+    assert len(bodies) == 1
+    assert bodies[0]["reasoning_effort"] == "low"
+    assert bodies[0]["tool_choice"] == "none"
+
+
+if __name__ == "__main__":
+    test_tool_rounds_send_callers_reasoning_effort()
+    test_final_synthesis_runs_at_low()
+    print("✅ request body tests passed")
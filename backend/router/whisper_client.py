@@ -12,6 +12,20 @@ logger = logging.getLogger(__name__)
 class WhisperSTTClient:
     def __init__(self, whisper_service_url: str):
         self.whisper_service_url = whisper_service_url.rstrip('/')
+        # Pooled client, so repeated transcriptions reuse the connection
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=60.0)
+        return self._client
+
+    async def aclose(self):
+        """Close the pooled client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def transcribe_audio(self, audio_data: bytes, language: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -32,24 +46,23 @@ class WhisperSTTClient:
             data["language"] = language if language is not None else "auto"
 
             # Make request to Whisper STT service
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.whisper_service_url}/transcribe",
-                    files=files,
-                    data=data
-                )
+            response = await self._get_client().post(
+                f"{self.whisper_service_url}/transcribe",
+                files=files,
+                data=data
+            )
 
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 503:
-                    raise Exception("STT service not available - whisper binary or model not found")
-                elif response.status_code == 408:
-                    raise Exception("Transcription timeout")
-                elif response.status_code == 413:
-                    raise Exception("Audio file too large")
-                else:
-                    error_detail = response.json().get("detail", "Unknown error") if response.headers.get("content-type", "").startswith("application/json") else response.text
-                    raise Exception(f"STT service error ({response.status_code}): {error_detail}")
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 503:
+                raise Exception("STT service not available - whisper binary or model not found")
+            elif response.status_code == 408:
+                raise Exception("Transcription timeout")
+            elif response.status_code == 413:
+                raise Exception("Audio file too large")
+            else:
+                error_detail = response.json().get("detail", "Unknown error") if response.headers.get("content-type", "").startswith("application/json") else response.text
+                raise Exception(f"STT service error ({response.status_code}): {error_detail}")
 
         except httpx.TimeoutException:
             raise Exception("STT service timeout")
@@ -67,12 +80,11 @@ class WhisperSTTClient:
             True if service is healthy, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.whisper_service_url}/health")
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("whisper_available", False)
-                return False
+            response = await self._get_client().get(f"{self.whisper_service_url}/health", timeout=5.0)
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("whisper_available", False)
+            return False
         except Exception as e:
             logger.warning(f"Whisper STT health check failed: {str(e)}")
             return False